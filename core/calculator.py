@@ -8,7 +8,6 @@ Implements:
 """
 
 import os
-import math
 from decimal import Decimal, ROUND_DOWN, InvalidOperation
 from typing import Optional, Dict, Any
 
@@ -156,9 +155,11 @@ def floor_to_step(value: Decimal, step_size: Decimal) -> Decimal:
     if step_size <= 0:
         raise CalculatorError(f"Invalid step_size: {step_size}")
     
-    # Use math.floor for guaranteed floor behavior
-    steps = math.floor(float(value / step_size))
-    return Decimal(str(steps)) * step_size
+    # Exact Decimal floor division (no float round trip that could round up)
+    steps, remainder = divmod(value, step_size)
+    if remainder < 0:
+        steps -= 1
+    return steps * step_size
 
 
 def floor_price_to_tick(price: Decimal, tick_size: Decimal) -> Decimal:
@@ -175,8 +176,34 @@ def floor_price_to_tick(price: Decimal, tick_size: Decimal) -> Decimal:
     if tick_size <= 0:
         raise CalculatorError(f"Invalid tick_size: {tick_size}")
     
-    steps = math.floor(float(price / tick_size))
-    return Decimal(str(steps)) * tick_size
+    steps, remainder = divmod(price, tick_size)
+    if remainder < 0:
+        steps -= 1
+    return steps * tick_size
+
+
+def ceil_to_step(value: Decimal, step_size: Decimal) -> Decimal:
+    """
+    Round a value UP to the nearest step size.
+    
+    Only for minimums (e.g. smallest quantity meeting a min notional) -
+    position sizing must still use floor_to_step().
+    
+    Args:
+        value: Value to ceil
+        step_size: Step size to ceil to
+        
+    Returns:
+        Ceiled value
+    """
+    if step_size <= 0:
+        raise CalculatorError(f"Invalid step_size: {step_size}")
+    
+    # Decimal divmod truncates toward zero, so only a positive remainder needs a bump
+    steps, remainder = divmod(value, step_size)
+    if remainder > 0:
+        steps += 1
+    return steps * step_size
 
 
 def calculate_position_size(
@@ -243,11 +270,11 @@ def calculate_position_size(
         
         # Calculate raw quantity based on risk
         # With leverage, we can control more with the same margin
-        raw_qty_risk = (risk_amount * Decimal(str(leverage))) / distance
+        raw_qty_risk = (risk_amount * Decimal(leverage)) / distance
         
         # CRITICAL: Apply position size limit to prevent over-leveraging
         max_margin = balance * (max_position_percent / Decimal("100"))
-        max_notional = max_margin * Decimal(str(leverage))
+        max_notional = max_margin * Decimal(leverage)
         max_qty_position = max_notional / entry_price
         
         # Take the MINIMUM of risk-based qty and position limit
@@ -263,7 +290,7 @@ def calculate_position_size(
         
         # Calculate actual margin and notional for logging
         actual_notional = safe_qty * entry_price
-        actual_margin = actual_notional / Decimal(str(leverage))
+        actual_margin = actual_notional / Decimal(leverage)
         margin_percent = (actual_margin / balance) * Decimal("100")
         
         console.print(f"[dim]Calculator: balance={balance}, risk={risk_percent}%, "
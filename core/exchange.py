@@ -9,15 +9,26 @@ Implements:
 """
 
 import os
+import ssl
+import json
 import asyncio
 import time
 import uuid
+from pathlib import Path
 from decimal import Decimal
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Tuple
 
+import aiohttp
+import certifi
 import ccxt.async_support as ccxt
 from rich.console import Console
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 console = Console()
 
 # Load config from environment (with defaults)
@@ -28,6 +39,27 @@ MAX_RETRIES = int(os.getenv('MAX_RETRIES', '5'))
 RETRY_BASE_DELAY = 1.0
 RETRY_MAX_DELAY = 30.0
 
+# HTTP connection pool (keep TCP+TLS warm across scan intervals)
+HTTP_KEEPALIVE_TIMEOUT = 75.0  # seconds an idle connection is kept open
+HTTP_DNS_CACHE_TTL = 300       # seconds DNS lookups are cached
+HTTP_POOL_LIMIT = int(os.getenv('HTTP_POOL_LIMIT', '64'))  # max open connections
+
+# Market snapshot written on every load so panic.py can skip load_markets()
+MARKETS_SNAPSHOT_DIR = Path(__file__).parent.parent
+
+
+def markets_snapshot_path(testnet: bool) -> Path:
+    """
+    Get the on-disk market snapshot path (separate files per network).
+    
+    Args:
+        testnet: Whether the snapshot is for testnet markets
+        
+    Returns:
+        Snapshot file path
+    """
+    return MARKETS_SNAPSHOT_DIR / ("markets.testnet.json" if testnet else "markets.json")
+
 
 class StaleDataError(Exception):
     """
@@ -73,8 +105,10 @@ class SafeExchange:
         self.secret_key = secret_key
         self.testnet = testnet
         self.exchange: Optional[ccxt.binanceusdm] = None
+        self._session: Optional[aiohttp.ClientSession] = None
         self._markets_cache: Dict[str, Any] = {}
-        self._last_markets_load: float = 0
+        self._symbol_index: Dict[Tuple[str, str], str] = {}  # (base, quote) -> symbol
+        self._last_markets_load: Optional[float] = None  # time.monotonic() of last load
         self._markets_cache_ttl: float = 3600  # 1 hour
     
     async def connect(self) -> None:
@@ -105,8 +139,24 @@ class SafeExchange:
             # Suppress warning when fetching all open orders (required for Ghost Synchronizer)
             config['options']['warnOnFetchOpenOrdersWithoutSymbol'] = False
         
+        # Long-lived keep-alive session shared by every REST call
+        # (aiohttp defaults drop idle connections after 15s, i.e. between scans)
+        connector = aiohttp.TCPConnector(
+            ssl=ssl.create_default_context(cafile=certifi.where()),
+            limit=HTTP_POOL_LIMIT,
+            ttl_dns_cache=HTTP_DNS_CACHE_TTL,
+            keepalive_timeout=HTTP_KEEPALIVE_TIMEOUT,
+            enable_cleanup_closed=True
+        )
+        self._session = aiohttp.ClientSession(connector=connector, trust_env=True)
+        config['session'] = self._session
+        
         self.exchange = ccxt.binanceusdm(config)
         
+        # Use orjson for response decoding if available (stdlib json otherwise)
+        if ORJSON_AVAILABLE:
+            self._install_fast_json()
+        
         if self.testnet:
             # DO NOT use set_sandbox_mode(True) anymore - Binance has changed the mechanism
             # Manually set URL for Testnet Futures (includes all API versions)
@@ -127,23 +177,97 @@ class SafeExchange:
         
         console.print("[green]✓ Exchange connected[/green]")
     
+    def _install_fast_json(self) -> None:
+        """
+        Replace CCXT's stdlib JSON codec with orjson.
+        
+        Positions/orders payloads are decoded on every safety cycle,
+        so the faster C decoder cuts per-call CPU noticeably.
+        """
+        exchange = self.exchange
+        stdlib_json = exchange.json
+        
+        def parse_json(http_response):
+            # Same contract as ccxt's parse_json: None for non-JSON bodies
+            try:
+                if exchange.is_json_encoded_object(http_response):
+                    return orjson.loads(http_response)
+            except ValueError:
+                pass
+            return None
+        
+        def dump_json(data, params=None):
+            # orjson rejects types stdlib json handles (e.g. non-str keys) - fall back
+            try:
+                return orjson.dumps(data).decode()
+            except TypeError:
+                return stdlib_json(data, params)
+        
+        exchange.parse_json = parse_json
+        exchange.json = dump_json
+    
     async def disconnect(self) -> None:
         """Close the exchange connection."""
         if self.exchange:
             await self.exchange.close()
             self.exchange = None
             console.print("[green]✓ Exchange disconnected[/green]")
+        
+        # ccxt does not close sessions it did not create
+        if self._session:
+            await self._session.close()
+            self._session = None
     
     async def _load_markets(self) -> None:
         """Load and cache market information."""
         if self.exchange is None:
             raise ExchangeError("Exchange not connected")
         
-        current_time = time.time()
-        if (current_time - self._last_markets_load) > self._markets_cache_ttl:
-            self._markets_cache = await self.exchange.load_markets()
+        current_time = time.monotonic()
+        if (
+            self._last_markets_load is None
+            or (current_time - self._last_markets_load) > self._markets_cache_ttl
+        ):
+            # reload=True so ccxt refetches instead of returning its own copy
+            self._markets_cache = await self.exchange.load_markets(reload=self._last_markets_load is not None)
             self._last_markets_load = current_time
+            self._build_symbol_index()
             console.print(f"[dim]Loaded {len(self._markets_cache)} markets[/dim]")
+            
+            try:
+                await asyncio.to_thread(self._save_markets_snapshot)
+            except Exception as e:
+                console.print(f"[dim]Could not write market snapshot: {e}[/dim]")
+    
+    def _build_symbol_index(self) -> None:
+        """Index markets by (base, quote), preferring perpetuals over dated futures."""
+        index: Dict[Tuple[str, str], str] = {}
+        for symbol, market in self._markets_cache.items():
+            key = (market.get('base'), market.get('quote'))
+            if key not in index or market.get('swap'):
+                index[key] = symbol
+        self._symbol_index = index
+    
+    def _save_markets_snapshot(self) -> None:
+        """Persist loaded markets to disk (atomic replace) for panic.py."""
+        path = markets_snapshot_path(self.testnet)
+        tmp_path = path.with_suffix('.tmp')
+        
+        if ORJSON_AVAILABLE:
+            tmp_path.write_bytes(orjson.dumps(self._markets_cache))
+        else:
+            tmp_path.write_text(json.dumps(self._markets_cache))
+        
+        os.replace(tmp_path, path)
+    
+    async def refresh_markets(self) -> None:
+        """
+        Reload market metadata if the cache TTL has expired.
+        
+        Cheap no-op while the cache is fresh; call once per loop iteration
+        so get_market_info() stays a pure dict lookup.
+        """
+        await self._load_markets()
     
     def get_market_info(self, symbol: str) -> Dict[str, Any]:
         """
@@ -158,9 +282,40 @@ class SafeExchange:
         Raises:
             ExchangeError: If symbol not found
         """
-        if symbol not in self._markets_cache:
+        market = self._markets_cache.get(symbol)
+        if market is None:
             raise ExchangeError(f"Symbol {symbol} not found in markets")
-        return self._markets_cache[symbol]
+        return market
+    
+    def find_symbol(self, base: str, quote: str) -> Optional[str]:
+        """
+        Find the market symbol for a base/quote pair (perpetual if listed).
+        
+        Args:
+            base: Base currency (e.g. 'BTC')
+            quote: Quote currency (e.g. 'USDT')
+            
+        Returns:
+            Symbol (e.g. 'BTC/USDT:USDT') or None if not listed
+        """
+        return self._symbol_index.get((base, quote))
+    
+    def active_symbols(self, suffixes: Tuple[str, ...]) -> List[str]:
+        """
+        List active markets whose symbol ends with one of the given suffixes.
+        
+        Args:
+            suffixes: Symbol suffixes to keep (e.g. ('/USDT:USDT',))
+            
+        Returns:
+            List of matching active symbols (empty if markets not loaded)
+        """
+        if not self._markets_cache:
+            return []
+        return [
+            symbol for symbol, market in self._markets_cache.items()
+            if symbol.endswith(suffixes) and market.get('active', True)
+        ]
     
     async def _retry_async(self, operation, *args, **kwargs):
         """
@@ -249,10 +404,62 @@ class SafeExchange:
         
         return ticker
     
-    async def fetch_tickers(self) -> Dict[str, Any]:
+    async def fetch_last_prices(self, symbols: List[str]) -> Dict[str, Any]:
+        """
+        Fetch last prices for several symbols with one request, with stale data guard.
+        
+        Uses the all-symbol price endpoint when ccxt supports it, otherwise
+        falls back to concurrent per-symbol fetch_ticker calls.
+        
+        Args:
+            symbols: Trading symbols
+            
+        Returns:
+            Dictionary of symbol -> last price (the exchange's exact decimal string
+            when available), or the exception for that symbol (StaleDataError /
+            ExchangeError) so one bad symbol doesn't fail the rest
+            
+        Raises:
+            ExchangeError: If the batch fetch fails
+        """
+        if self.exchange is None:
+            raise ExchangeError("Exchange not connected")
+        
+        if not self.exchange.has.get('fetchLastPrices'):
+            tickers = await asyncio.gather(
+                *(self.fetch_ticker(symbol) for symbol in symbols),
+                return_exceptions=True
+            )
+            return {
+                symbol: ticker if isinstance(ticker, Exception) else ticker.get('last')
+                for symbol, ticker in zip(symbols, tickers)
+            }
+        
+        entries = await self._retry_async(self.exchange.fetch_last_prices, symbols)
+        
+        prices: Dict[str, Any] = {}
+        for symbol in symbols:
+            entry = entries.get(symbol)
+            if entry is None:
+                prices[symbol] = ExchangeError(f"No price returned for {symbol}")
+                continue
+            try:
+                if entry.get('timestamp'):
+                    self._check_data_freshness(entry['timestamp'])
+                # Raw string parses straight to an exact Decimal (no float hop)
+                prices[symbol] = (entry.get('info') or {}).get('price') or entry.get('price')
+            except StaleDataError as e:
+                prices[symbol] = e
+        
+        return prices
+    
+    async def fetch_tickers(self, symbols: Optional[List[str]] = None) -> Dict[str, Any]:
         """
-        Fetch all tickers (for volume ranking).
+        Fetch tickers (for volume ranking).
         
+        Args:
+            symbols: Only return these symbols (all tickers if None)
+            
         Returns:
             Dictionary of tickers keyed by symbol
             
@@ -262,7 +469,7 @@ class SafeExchange:
         if self.exchange is None:
             raise ExchangeError("Exchange not connected")
         
-        return await self._retry_async(self.exchange.fetch_tickers)
+        return await self._retry_async(self.exchange.fetch_tickers, symbols)
     
     async def fetch_balance(self) -> Dict[str, Any]:
         """
@@ -276,6 +483,25 @@ class SafeExchange:
         
         return await self._retry_async(self.exchange.fetch_balance)
     
+    async def get_usdt_free(self) -> Decimal:
+        """
+        Fetch available USDT balance as an exact Decimal.
+        
+        Parses Binance's raw string 'availableBalance' directly, avoiding
+        the lossy float -> str -> Decimal round trip of the unified field.
+        
+        Returns:
+            Free USDT balance
+        """
+        balance = await self.fetch_balance()
+        
+        for asset in (balance.get('info') or {}).get('assets') or ():
+            if asset.get('asset') == 'USDT' and asset.get('availableBalance') is not None:
+                return Decimal(asset['availableBalance'])
+        
+        # Fallback to CCXT's unified (float) field
+        return Decimal(str((balance.get('USDT') or {}).get('free') or 0))
+    
     async def fetch_positions(self, symbol: Optional[str] = None) -> List[Dict[str, Any]]:
         """
         Fetch open positions.
@@ -315,7 +541,8 @@ class SafeExchange:
         
         all_orders = []
         
-        # Method 1: Fetch regular open orders
+        # Fetch regular open orders
+        # (positionRisk carries no conditional order IDs, so it is not queried)
         try:
             if symbol:
                 regular_orders = await self._retry_async(self.exchange.fetch_open_orders, symbol)
@@ -325,34 +552,6 @@ class SafeExchange:
         except Exception as e:
             console.print(f"[yellow]⚠ Could not fetch regular orders: {e}[/yellow]")
         
-        # Method 2: Fetch positions to check for conditional orders
-        # On Binance Futures, conditional orders are attached to positions
-        try:
-            positions = await self.fetch_positions(symbol)
-            for pos in positions:
-                pos_symbol = pos.get('symbol')
-                
-                # For each position, check if it has stop loss or take profit attached
-                # Use fapiPrivateV2GetPositionRisk which includes stopPrice and takeProfitPrice
-                try:
-                    if pos_symbol:
-                        # Remove :USDT suffix for Binance API
-                        api_symbol = pos_symbol.replace('/', '').replace(':USDT', '')
-                        
-                        # Fetch position risk info which includes conditional order prices
-                        position_risk = await self._retry_async(
-                            self.exchange.fapiPrivateV2GetPositionRisk,
-                            {'symbol': api_symbol}
-                        )
-                        
-                        # This returns position info including stopPrice fields
-                        # But we still need actual order IDs, so this doesn't help much
-                        pass
-                except:
-                    pass
-        except:
-            pass
-        
         return all_orders
     
     async def fetch_order(self, order_id: str, symbol: str) -> Dict[str, Any]:
@@ -399,6 +598,9 @@ class SafeExchange:
         # CRITICAL: Add UUID for idempotency
         params['newClientOrderId'] = self._generate_client_order_id()
         
+        # Return the fill (executed qty / avg price) in the response, not just an ACK
+        params.setdefault('newOrderRespType', 'RESULT')
+        
         console.print(f"[cyan]→ Creating market {side} order: {amount} {symbol}[/cyan]")
         console.print(f"[dim]  Client Order ID: {params['newClientOrderId']}[/dim]")
         
@@ -40,6 +40,13 @@ MAX_SL_RETRIES = 5
 # Maximum retries for take profit placement
 MAX_TP_RETRIES = 3
 
+# Fill confirmation polling (used only if the entry response has no fill info)
+FILL_POLL_ATTEMPTS = 10
+FILL_POLL_INTERVAL = 0.05  # seconds
+
+# Order statuses after which the fill can no longer change
+FINAL_ORDER_STATUSES = ('closed', 'canceled', 'cancelled', 'expired', 'rejected')
+
 
 class ExecutionError(Exception):
     """Error during order execution."""
@@ -361,12 +368,17 @@ async def execute_atomic_entry(
     executed_qty = parse_decimal(entry_order.get('filled', 0))
     average_price = parse_decimal(entry_order.get('average', 0))
     
-    # If not in immediate response, fetch the order
+    # If not in immediate response, poll the order until it reports the fill
+    # (returns as soon as it does instead of always waiting a fixed delay)
     if executed_qty == 0:
-        await asyncio.sleep(0.5)  # Brief delay for order to settle
-        fetched_order = await exchange.fetch_order(entry_order['id'], symbol)
-        executed_qty = parse_decimal(fetched_order.get('filled', 0))
-        average_price = parse_decimal(fetched_order.get('average', 0))
+        for _ in range(FILL_POLL_ATTEMPTS):
+            fetched_order = await exchange.fetch_order(entry_order['id'], symbol)
+            executed_qty = parse_decimal(fetched_order.get('filled', 0))
+            average_price = parse_decimal(fetched_order.get('average', 0))
+            
+            if executed_qty > 0 or (fetched_order.get('status') or '').lower() in FINAL_ORDER_STATUSES:
+                break
+            await asyncio.sleep(FILL_POLL_INTERVAL)
     
     result['executed_qty'] = executed_qty
     result['average_price'] = average_price
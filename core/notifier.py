@@ -13,18 +13,26 @@ Based on binance-trade-bot notification system.
 
 import os
 import asyncio
+import importlib.util
 from typing import Optional
 from rich.console import Console
 
-try:
-    import apprise
-    APPRISE_AVAILABLE = True
-except ImportError:
-    APPRISE_AVAILABLE = False
+# apprise loads 80+ service plugins on import - only pay that when notifications are configured
+APPRISE_AVAILABLE = importlib.util.find_spec('apprise') is not None
+apprise = None
 
 console = Console()
 
 
+def _load_apprise():
+    """Import apprise on first use."""
+    global apprise
+    if apprise is None:
+        import apprise as apprise_module
+        apprise = apprise_module
+    return apprise
+
+
 class Notifier:
     """
     Multi-platform notification sender using apprise.
@@ -74,6 +82,7 @@ class Notifier:
         
         # Initialize apprise
         try:
+            _load_apprise()
             self.apprise_instance = apprise.Apprise()
             
             # Add all notification URLs
@@ -15,6 +15,7 @@ from typing import List, Dict, Any, Optional, Tuple
 from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
+from rich.live import Live
 
 from .exchange import SafeExchange, ExchangeError
 from .calculator import parse_decimal, get_tick_size, floor_price_to_tick
@@ -77,12 +78,22 @@ def get_position_qty(position: Dict[str, Any]) -> Decimal:
         Absolute position quantity as Decimal
     """
     contracts = position.get('contracts', 0)
+    
+    # Fast paths: build the absolute Decimal in a single allocation
+    if isinstance(contracts, Decimal):
+        return abs(contracts)
+    if isinstance(contracts, float):
+        return Decimal(str(abs(contracts)))
+    if isinstance(contracts, int):
+        return Decimal(abs(contracts))
+    
     return abs(parse_decimal(contracts))
 
 
 def find_stop_loss_for_position(
     position: Dict[str, Any],
-    open_orders: List[Dict[str, Any]]
+    open_orders: List[Dict[str, Any]],
+    pos_side: Optional[str] = None
 ) -> Optional[Dict[str, Any]]:
     """
     Find the stop loss order for a given position.
@@ -90,12 +101,14 @@ def find_stop_loss_for_position(
     Args:
         position: Position dictionary
         open_orders: List of open orders
+        pos_side: 'LONG' or 'SHORT' if the caller already knows it
         
     Returns:
         Stop loss order if found, None otherwise
     """
     symbol = position.get('symbol')
-    pos_side = get_position_side(position)
+    if pos_side is None:
+        pos_side = get_position_side(position)
     
     # For a LONG position, SL should be a SELL order
     # For a SHORT position, SL should be a BUY order
@@ -115,6 +128,38 @@ def find_stop_loss_for_position(
     return None
 
 
+def find_stop_losses_for_position(
+    position: Dict[str, Any],
+    open_orders: List[Dict[str, Any]],
+    pos_side: Optional[str] = None
+) -> List[Dict[str, Any]]:
+    """
+    Find every stop loss order protecting a position.
+    
+    More than one exists only transiently, e.g. when a replaced SL could
+    not be cancelled.
+    
+    Args:
+        position: Position dictionary
+        open_orders: List of open orders
+        pos_side: 'LONG' or 'SHORT' if the caller already knows it
+        
+    Returns:
+        List of stop loss orders (empty if none)
+    """
+    symbol = position.get('symbol')
+    if pos_side is None:
+        pos_side = get_position_side(position)
+    expected_sl_side = 'sell' if pos_side == 'LONG' else 'buy'
+    
+    return [
+        order for order in open_orders
+        if order.get('symbol') == symbol
+        and is_stop_order(order)
+        and order.get('side', '').lower() == expected_sl_side
+    ]
+
+
 def check_sl_qty_mismatch(
     position_qty: Decimal,
     sl_qty: Decimal
@@ -229,13 +274,17 @@ async def fix_qty_mismatch(
     position: Dict[str, Any],
     sl_order: Dict[str, Any],
     stoploss_percent: Decimal
-) -> bool:
+) -> str:
     """
     Fix stop loss quantity mismatch.
     
     Process:
-    1. Cancel existing stop loss
-    2. Place new stop loss with correct quantity
+    1. Place new stop loss with correct quantity
+    2. Cancel existing stop loss
+    
+    The new SL goes in first so the position is never unprotected and no
+    settle delay is needed between the two requests. If placement fails,
+    the old (mismatched) SL is kept.
     
     Args:
         exchange: SafeExchange instance
@@ -244,7 +293,9 @@ async def fix_qty_mismatch(
         stoploss_percent: Stop loss percentage
         
     Returns:
-        True if mismatch was fixed
+        'fixed' if the new SL is placed and the old one cancelled,
+        'cancel_failed' if the new SL is placed but the old one is still open,
+        'failed' if the new SL could not be placed (old SL kept)
     """
     symbol = position.get('symbol')
     pos_qty = get_position_qty(position)
@@ -261,26 +312,161 @@ async def fix_qty_mismatch(
         border_style="yellow"
     ))
     
+    # Step 1: Place correct stop loss (errors are handled and reported inside)
+    if not await fix_missing_stop_loss(exchange, position, stoploss_percent):
+        console.print(f"[red]✗ Failed to fix mismatch (old SL kept): {sl_order['id']}[/red]")
+        return 'failed'
+    
     try:
-        # Step 1: Cancel existing stop loss
+        # Step 2: Cancel existing stop loss
         console.print(f"[yellow]→ Cancelling incorrect stop loss: {sl_order['id']}[/yellow]")
         await exchange.cancel_order(sl_order['id'], symbol)
+    except Exception as e:
+        # Both reduce-only stops remain; the correct one is already active.
+        # Next cycle prefers the correct one and retries this cancel
+        console.print(f"[yellow]⚠ New SL active but old SL {sl_order['id']} not cancelled: {e}[/yellow]")
+        return 'cancel_failed'
+    
+    return 'fixed'
+
+
+async def _sync_position(
+    exchange: SafeExchange,
+    position: Dict[str, Any],
+    open_orders: List[Dict[str, Any]],
+    stoploss_percent: Decimal
+) -> Tuple[Tuple[str, ...], Optional[str]]:
+    """
+    Check a single position's stop loss, turning any exception into an error row.
+    
+    Positions are synced concurrently, so one symbol's failure (e.g.
+    ExchangeError from get_market_info) must not abort the others.
+    
+    Args:
+        exchange: SafeExchange instance
+        position: Position dictionary
+        open_orders: List of open orders
+        stoploss_percent: Stop loss percentage for new SLs
+        
+    Returns:
+        Tuple of (table row, outcome) - see _check_position
+    """
+    try:
+        return await _check_position(exchange, position, open_orders, stoploss_percent)
+    except Exception as e:
+        symbol = position.get('symbol')
+        console.print(f"[red]✗ Ghost sync failed for {symbol}: {e}[/red]")
+        return (symbol, "-", "-", "[red]ERROR[/red]", "Sync Failed"), 'unprotected'
+
+
+async def _check_position(
+    exchange: SafeExchange,
+    position: Dict[str, Any],
+    open_orders: List[Dict[str, Any]],
+    stoploss_percent: Decimal
+) -> Tuple[Tuple[str, ...], Optional[str]]:
+    """
+    Check a single position's stop loss and fix it if needed.
+    
+    Args:
+        exchange: SafeExchange instance
+        position: Position dictionary
+        open_orders: List of open orders
+        stoploss_percent: Stop loss percentage for new SLs
         
-        # Brief delay to ensure cancellation is processed
-        await asyncio.sleep(0.3)
+    Returns:
+        Tuple of (table row, outcome) where outcome is 'missing_sl_fixed',
+        'qty_mismatch_fixed', 'error' (position still has a stop loss),
+        'unprotected' (no stop loss could be confirmed) or None when
+        nothing was needed
+    """
+    symbol = position.get('symbol')
+    pos_qty = get_position_qty(position)
+    pos_side = get_position_side(position)
+    
+    # Find corresponding stop loss(es)
+    sl_orders = find_stop_losses_for_position(position, open_orders, pos_side)
+    
+    if not sl_orders:
+        # CASE 1: Missing stop loss
+        success = await fix_missing_stop_loss(exchange, position, stoploss_percent)
+        if success:
+            return (symbol, pos_side, str(pos_qty), "[red]MISSING[/red]", "SL Created"), 'missing_sl_fixed'
         
-        # Step 2: Place correct stop loss
-        return await fix_missing_stop_loss(exchange, position, stoploss_percent)
+        console.print(f"[yellow]⚠ SL placement failed for {symbol} - will retry next cycle[/yellow]")
         
-    except Exception as e:
-        console.print(f"[red]✗ Failed to fix mismatch: {e}[/red]")
-        return False
+        # Send critical alert for naked position
+        notifier = get_notifier()
+        if notifier and notifier.is_enabled():
+            try:
+                await notifier.send_critical_alert(
+                    title="NAKED POSITION DETECTED",
+                    message=f"Position without stop loss: {symbol}",
+                    details=f"Side: {pos_side}\nQty: {pos_qty}\nFailed to place SL - MANUAL INTERVENTION NEEDED"
+                )
+            except Exception as e:
+                console.print(f"[yellow]⚠ Failed to send alert: {e}[/yellow]")
+        
+        return (symbol, pos_side, str(pos_qty), "[red]MISSING[/red]", "SL Failed"), 'unprotected'
+    
+    # Check quantity match - a correct SL alongside wrong-qty leftovers (a
+    # previous fix whose cancel failed) only needs the leftovers cancelled
+    matching = None
+    mismatched = []
+    for order in sl_orders:
+        if check_sl_qty_mismatch(pos_qty, parse_decimal(order.get('amount', 0)))[0]:
+            mismatched.append(order)
+        elif matching is None:
+            matching = order
+    
+    if matching is not None:
+        if not mismatched:
+            # CASE 3: All good
+            return (symbol, pos_side, str(pos_qty), "[green]OK[/green]", "-"), None
+        
+        status = f"[yellow]STALE SL x{len(mismatched)}[/yellow]"
+        try:
+            for order in mismatched:
+                console.print(f"[yellow]→ Retrying cancel of incorrect stop loss: {order['id']}[/yellow]")
+                await exchange.cancel_order(order['id'], symbol)
+        except Exception as e:
+            console.print(f"[red]✗ Old SL for {symbol} still not cancelled: {e}[/red]")
+            return (symbol, pos_side, str(pos_qty), status, "Cancel Failed"), 'error'
+        return (symbol, pos_side, str(pos_qty), status, "Old SL Cancelled"), 'qty_mismatch_fixed'
+    
+    # CASE 2: Quantity mismatch
+    sl_order = mismatched[0]
+    sl_qty = parse_decimal(sl_order.get('amount', 0))
+    diff = abs(pos_qty - sl_qty)
+    status = f"[yellow]MISMATCH ({sl_qty})[/yellow]"
+    outcome = await fix_qty_mismatch(exchange, position, sl_order, stoploss_percent)
+    if outcome == 'fixed':
+        return (symbol, pos_side, str(pos_qty), status, "Qty Fixed"), 'qty_mismatch_fixed'
+    if outcome == 'cancel_failed':
+        # Position is protected by the new SL; the old one is retried next cycle
+        return (symbol, pos_side, str(pos_qty), status, "Old SL Not Cancelled"), 'error'
+    
+    # Send critical alert for mismatch fix failure
+    notifier = get_notifier()
+    if notifier and notifier.is_enabled():
+        try:
+            await notifier.send_critical_alert(
+                title="SL QUANTITY MISMATCH",
+                message=f"Failed to fix SL mismatch: {symbol}",
+                details=f"Position: {pos_qty}\nSL: {sl_qty}\nDiff: {diff}\nMANUAL FIX REQUIRED"
+            )
+        except Exception as e:
+            console.print(f"[yellow]⚠ Failed to send alert: {e}[/yellow]")
+    
+    return (symbol, pos_side, str(pos_qty), status, "Fix Failed"), 'error'
 
 
 async def ghost_synchronizer(
     exchange: SafeExchange,
     stoploss_percent: Decimal = Decimal("2.0"),
-    symbol: Optional[str] = None
+    symbol: Optional[str] = None,
+    positions: Optional[List[Dict[str, Any]]] = None,
+    open_orders: Optional[List[Dict[str, Any]]] = None
 ) -> Dict[str, Any]:
     """
     Ghost Synchronizer - Main safety routine.
@@ -303,6 +489,8 @@ async def ghost_synchronizer(
         exchange: SafeExchange instance
         stoploss_percent: Stop loss percentage for new SLs
         symbol: Optional symbol to filter orders (recommended to avoid rate limits)
+        positions: Pre-fetched open positions (fetched if None)
+        open_orders: Pre-fetched open orders (fetched if None)
         
     Returns:
         Dictionary with sync results
@@ -312,6 +500,8 @@ async def ghost_synchronizer(
         'missing_sl_fixed': 0,
         'qty_mismatch_fixed': 0,
         'errors': 0,
+        'failed_symbols': set(),  # Symbols whose SL could not be fixed this cycle
+        'unprotected_symbols': set(),  # Subset left without a confirmed stop loss
         'all_synced': False
     }
     
@@ -325,8 +515,9 @@ async def ghost_synchronizer(
         return result
     
     try:
-        # Fetch all positions first
-        positions = await exchange.fetch_positions()
+        # Fetch all positions first (unless caller already has them)
+        if positions is None:
+            positions = await exchange.fetch_positions()
         
         if not positions:
             console.print("[green]✓ No open positions - nothing to sync[/green]")
@@ -342,7 +533,8 @@ async def ghost_synchronizer(
                 return result
         
         # Fetch open orders - use symbol filter if available to reduce rate limit impact
-        open_orders = await exchange.fetch_open_orders(symbol)
+        if open_orders is None:
+            open_orders = await exchange.fetch_open_orders(symbol)
         
         console.print(f"[dim]Found {len(positions)} position(s), {len(open_orders)} open order(s)[/dim]")
         
@@ -356,92 +548,34 @@ async def ghost_synchronizer(
         
         all_synced = True
         
-        for position in positions:
-            symbol = position.get('symbol')
-            pos_qty = get_position_qty(position)
-            pos_side = get_position_side(position)
-            
-            result['positions_checked'] += 1
-            
-            # Find corresponding stop loss
-            sl_order = find_stop_loss_for_position(position, open_orders)
-            
-            if sl_order is None:
-                # CASE 1: Missing stop loss
-                table.add_row(
-                    symbol,
-                    pos_side,
-                    str(pos_qty),
-                    "[red]MISSING[/red]",
-                    "Creating SL"
-                )
-                
-                success = await fix_missing_stop_loss(exchange, position, stoploss_percent)
-                if success:
-                    result['missing_sl_fixed'] += 1
-                else:
-                    result['errors'] += 1
-                    all_synced = False
-                    console.print(f"[yellow]⚠ SL placement failed for {symbol} - will retry next cycle[/yellow]")
-                    
-                    # Send critical alert for naked position
-                    notifier = get_notifier()
-                    if notifier and notifier.is_enabled():
-                        try:
-                            await notifier.send_critical_alert(
-                                title="NAKED POSITION DETECTED",
-                                message=f"Position without stop loss: {symbol}",
-                                details=f"Side: {pos_side}\nQty: {pos_qty}\nFailed to place SL - MANUAL INTERVENTION NEEDED"
-                            )
-                        except Exception as e:
-                            console.print(f"[yellow]⚠ Failed to send alert: {e}[/yellow]")
-                    
-            else:
-                # Check quantity match
-                sl_qty = parse_decimal(sl_order.get('amount', 0))
-                is_mismatch, diff = check_sl_qty_mismatch(pos_qty, sl_qty)
-                
-                if is_mismatch:
-                    # CASE 2: Quantity mismatch
-                    table.add_row(
-                        symbol,
-                        pos_side,
-                        str(pos_qty),
-                        f"[yellow]MISMATCH ({sl_qty})[/yellow]",
-                        "Fixing Qty"
-                    )
+        # Check/fix every position concurrently and stream rows as they resolve
+        tasks = [
+            asyncio.create_task(_sync_position(exchange, position, open_orders, stoploss_percent))
+            for position in positions
+        ]
+        
+        try:
+            with Live(table, console=console, refresh_per_second=4):
+                for fut in asyncio.as_completed(tasks):
+                    row, outcome = await fut
+                    table.add_row(*row)
+                    result['positions_checked'] += 1
                     
-                    success = await fix_qty_mismatch(
-                        exchange, position, sl_order, stoploss_percent
-                    )
-                    if success:
-                        result['qty_mismatch_fixed'] += 1
-                    else:
+                    if outcome in ('error', 'unprotected'):
                         result['errors'] += 1
+                        result['failed_symbols'].add(row[0])
+                        if outcome == 'unprotected':
+                            result['unprotected_symbols'].add(row[0])
                         all_synced = False
-                        
-                        # Send critical alert for mismatch fix failure
-                        notifier = get_notifier()
-                        if notifier and notifier.is_enabled():
-                            try:
-                                await notifier.send_critical_alert(
-                                    title="SL QUANTITY MISMATCH",
-                                    message=f"Failed to fix SL mismatch: {symbol}",
-                                    details=f"Position: {pos_qty}\nSL: {sl_qty}\nDiff: {diff}\nMANUAL FIX REQUIRED"
-                                )
-                            except Exception as e:
-                                console.print(f"[yellow]⚠ Failed to send alert: {e}[/yellow]")
-                else:
-                    # CASE 3: All good
-                    table.add_row(
-                        symbol,
-                        pos_side,
-                        str(pos_qty),
-                        "[green]OK[/green]",
-                        "-"
-                    )
-        
-        console.print(table)
+                    elif outcome is not None:
+                        result[outcome] += 1
+        finally:
+            # Never leave SL placements/cancels running unobserved (e.g. on cancellation)
+            pending = [task for task in tasks if not task.done()]
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
         
         result['all_synced'] = all_synced and result['errors'] == 0
         
@@ -503,13 +637,20 @@ async def verify_position_safety(exchange: SafeExchange, symbol: Optional[str] =
         return False
 
 
-async def get_position_summary(exchange: SafeExchange, symbol: Optional[str] = None) -> List[Dict[str, Any]]:
+async def get_position_summary(
+    exchange: SafeExchange,
+    symbol: Optional[str] = None,
+    positions: Optional[List[Dict[str, Any]]] = None,
+    open_orders: Optional[List[Dict[str, Any]]] = None
+) -> List[Dict[str, Any]]:
     """
     Get a summary of all positions with their protection status.
     
     Args:
         exchange: SafeExchange instance
         symbol: Optional symbol to filter orders (recommended to avoid rate limits)
+        positions: Pre-fetched open positions (fetched if None)
+        open_orders: Pre-fetched open orders (fetched if None)
         
     Returns:
         List of position summaries
@@ -517,8 +658,10 @@ async def get_position_summary(exchange: SafeExchange, symbol: Optional[str] = N
     summaries = []
     
     try:
-        positions = await exchange.fetch_positions()
-        open_orders = await exchange.fetch_open_orders(symbol)
+        if positions is None:
+            positions = await exchange.fetch_positions()
+        if open_orders is None:
+            open_orders = await exchange.fetch_open_orders(symbol)
         
         for position in positions:
             symbol = position.get('symbol')
@@ -527,7 +670,7 @@ async def get_position_summary(exchange: SafeExchange, symbol: Optional[str] = N
             entry_price = parse_decimal(position.get('entryPrice', 0))
             unrealized_pnl = parse_decimal(position.get('unrealizedPnl', 0))
             
-            sl_order = find_stop_loss_for_position(position, open_orders)
+            sl_order = find_stop_loss_for_position(position, open_orders, pos_side)
             
             summary = {
                 'symbol': symbol,
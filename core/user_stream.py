@@ -0,0 +1,185 @@
+"""
+core/user_stream.py - Binance Futures User Data Stream
+
+Implements:
+- listenKey lifecycle (create, keepalive, close)
+- Websocket listener for ORDER_TRADE_UPDATE / ACCOUNT_UPDATE events
+- Event-invalidated snapshot of positions + open orders, so the trading
+  loop only hits REST when the account actually changed (or the
+  watchdog expires)
+"""
+
+import os
+import asyncio
+import time
+from typing import Optional, Dict, Any, List, Tuple
+
+import aiohttp
+from rich.console import Console
+
+from .exchange import SafeExchange
+
+console = Console()
+
+# Load config from environment (with defaults)
+USER_STREAM_WATCHDOG_SECONDS = float(os.getenv('USER_STREAM_WATCHDOG_SECONDS', '30'))
+
+# Binance requires a keepalive at least every 60 minutes
+LISTEN_KEY_KEEPALIVE_SECONDS = 30 * 60
+RECONNECT_DELAY = 5.0
+
+WS_URL_MAINNET = 'wss://fstream.binance.com/ws/'
+WS_URL_TESTNET = 'wss://stream.binancefuture.com/ws/'
+
+# Events that change positions or open orders
+ACCOUNT_EVENTS = ('ORDER_TRADE_UPDATE', 'ACCOUNT_UPDATE')
+
+
+class UserDataStream:
+    """
+    Push-based replacement for polling positions/orders every iteration.
+
+    The websocket only marks the cached snapshot dirty; the snapshot itself
+    is still fetched through SafeExchange so it keeps CCXT's unified format
+    and all retry/safety guards.
+
+    CRITICAL: If the stream is down, every snapshot() falls back to REST.
+    """
+
+    def __init__(
+        self,
+        exchange: SafeExchange,
+        watchdog_seconds: float = USER_STREAM_WATCHDOG_SECONDS
+    ):
+        """
+        Initialize user data stream.
+
+        Args:
+            exchange: Connected SafeExchange instance
+            watchdog_seconds: Max snapshot age before forcing a REST refresh
+        """
+        self.exchange = exchange
+        self.watchdog_seconds = watchdog_seconds
+
+        self._listen_key: Optional[str] = None
+        self._task: Optional[asyncio.Task] = None
+        self._connected = False
+        self._dirty = True
+        self._positions: List[Dict[str, Any]] = []
+        self._open_orders: List[Dict[str, Any]] = []
+        self._snapshot_time: float = 0
+
+    async def start(self) -> None:
+        """Create a listenKey and start the listener task."""
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the listener and close the listenKey."""
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+        if self._listen_key and self.exchange.exchange:
+            try:
+                await self.exchange.exchange.fapiPrivateDeleteListenKey()
+            except Exception:
+                pass
+        self._listen_key = None
+        self._connected = False
+
+    def invalidate(self) -> None:
+        """Force the next snapshot() to refetch (e.g. after placing orders)."""
+        self._dirty = True
+
+    async def snapshot(self) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """
+        Get positions and open orders, refetching only when needed.
+
+        Returns:
+            Tuple of (positions, open_orders)
+        """
+        age = time.monotonic() - self._snapshot_time
+
+        if self._dirty or not self._connected or age > self.watchdog_seconds:
+            # Clear BEFORE fetching so events arriving mid-fetch are not lost
+            self._dirty = False
+            try:
+                self._positions, self._open_orders = await asyncio.gather(
+                    self.exchange.fetch_positions(),
+                    self.exchange.fetch_open_orders()
+                )
+            except Exception:
+                self._dirty = True
+                raise
+            self._snapshot_time = time.monotonic()
+
+        return list(self._positions), list(self._open_orders)
+
+    def _ws_url(self) -> str:
+        """Get websocket URL for the current listenKey."""
+        base = WS_URL_TESTNET if self.exchange.testnet else WS_URL_MAINNET
+        return f"{base}{self._listen_key}"
+
+    async def _create_listen_key(self) -> None:
+        """Create (or reuse) the user data listenKey."""
+        response = await self.exchange.exchange.fapiPrivatePostListenKey()
+        self._listen_key = response['listenKey']
+
+    async def _run(self) -> None:
+        """Connect, listen and reconnect until cancelled."""
+        while True:
+            try:
+                await self._create_listen_key()
+                await self._listen()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                console.print(f"[yellow]⚠ User data stream error: {e} - falling back to REST[/yellow]")
+
+            self._connected = False
+            self._dirty = True
+            await asyncio.sleep(RECONNECT_DELAY)
+
+    async def _listen(self) -> None:
+        """Consume websocket messages until the connection drops."""
+        session = self.exchange._session
+        last_keepalive = time.monotonic()
+
+        async with session.ws_connect(self._ws_url(), heartbeat=60) as ws:
+            self._connected = True
+            self._dirty = True  # Events may have been missed while disconnected
+            console.print("[green]✓ User data stream connected[/green]")
+
+            while True:
+                # Wait only until the next keepalive is due, so a message just
+                # before the deadline can't push the PUT out to key expiry
+                keepalive_in = LISTEN_KEY_KEEPALIVE_SECONDS - (time.monotonic() - last_keepalive)
+                try:
+                    msg = await ws.receive(timeout=max(0.0, keepalive_in))
+                except asyncio.TimeoutError:
+                    msg = None
+
+                if time.monotonic() - last_keepalive >= LISTEN_KEY_KEEPALIVE_SECONDS:
+                    await self.exchange.exchange.fapiPrivatePutListenKey()
+                    last_keepalive = time.monotonic()
+
+                if msg is None:
+                    continue
+
+                if msg.type in (aiohttp.WSMsgType.CLOSED, aiohttp.WSMsgType.ERROR):
+                    return
+
+                if msg.type != aiohttp.WSMsgType.TEXT:
+                    continue
+
+                event_type = msg.json().get('e')
+
+                if event_type in ACCOUNT_EVENTS:
+                    self._dirty = True
+                elif event_type == 'listenKeyExpired':
+                    console.print("[yellow]⚠ listenKey expired - reconnecting user data stream[/yellow]")
+                    return
@@ -8,12 +8,16 @@ Implements:
 """
 
 import asyncio
+import contextlib
+import functools
 import os
 import signal
 import sys
-from decimal import Decimal
+import traceback
+from dataclasses import dataclass
+from decimal import Decimal, InvalidOperation
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Dict, Tuple
 
 from dotenv import load_dotenv
 from rich.console import Console
@@ -21,13 +25,22 @@ from rich.panel import Panel
 from rich.live import Live
 from rich.table import Table
 
+try:
+    import uvloop  # libuv-based event loop (not available on Windows)
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
+# Project root, resolved once
+PROJECT_ROOT = Path(__file__).parent
+ENV_PATH = PROJECT_ROOT / '.env'
+
 # CRITICAL: Load .env BEFORE importing other modules
 # This ensures all modules get the correct config values
-env_path = Path(__file__).parent / '.env'
-load_dotenv(env_path)
+load_dotenv(ENV_PATH)
 
 # Add project root to path
-sys.path.insert(0, str(Path(__file__).parent))
+sys.path.insert(0, str(PROJECT_ROOT))
 
 from core.bootstrap import bootstrap_system, BootstrapError, SingleInstanceLock
 from core.exchange import create_exchange, SafeExchange, StaleDataError, ExchangeError
@@ -36,50 +49,176 @@ from core.execution import execute_atomic_entry, SpreadTooWideError
 from core.safety import ghost_synchronizer, get_position_summary, display_position_summary
 from core.risk_manager import DynamicRiskManager
 from core.notifier import Notifier, set_notifier, get_notifier
-from strategy.scanner import scan_market, get_default_symbols, fetch_top_symbols
+from core.user_stream import UserDataStream
+from strategy.scanner import scan_market, get_default_symbols, fetch_top_symbols, invalidate_symbol_cache
 from strategy.manager import PositionManager
 
 console = Console()
 
-# Global flag for graceful shutdown
-shutdown_requested = False
-lock: Optional[SingleInstanceLock] = None
-exchange: Optional[SafeExchange] = None
-notifier: Optional[Notifier] = None
+# Decimal constants (avoid re-parsing literals on the entry path)
+DEC_ONE = Decimal("1")
+DEC_HUNDRED = Decimal("100")
 
+# Start prefetching next-iteration data this many seconds before the scan deadline
+PREFETCH_LEAD_SECONDS = 2.0
 
-def signal_handler(signum, frame):
-    """Handle shutdown signals gracefully."""
-    global shutdown_requested
+# Max entries placed concurrently per batch (each is several order requests)
+MAX_PARALLEL_ENTRIES = 3
+
+# Non-verbose mode: full iteration header every N iterations, "Next scan" line at most once per interval
+HEADER_PANEL_EVERY = 10
+NEXT_SCAN_LOG_INTERVAL = 60.0
+
+
+class AppContext:
+    """
+    Runtime state shared by the trading loop, signal handlers and cleanup.
+    
+    Replaces module-level globals so every dependency is passed explicitly.
+    """
+    
+    __slots__ = ('config', 'exchange', 'lock', 'notifier', 'user_stream', 'shutdown_event', 'loop')
     
+    def __init__(self, loop: asyncio.AbstractEventLoop):
+        """
+        Initialize application context.
+        
+        Args:
+            loop: Running event loop (signal handlers wake it thread-safely)
+        """
+        self.loop = loop
+        self.shutdown_event = asyncio.Event()
+        self.config: Optional['BotConfig'] = None
+        self.exchange: Optional[SafeExchange] = None
+        self.lock: Optional[SingleInstanceLock] = None
+        self.notifier: Optional[Notifier] = None
+        self.user_stream: Optional[UserDataStream] = None
+
+
+def signal_handler(ctx: AppContext, signum, frame):
+    """Handle shutdown signals gracefully."""
     sig_name = signal.Signals(signum).name
     console.print(f"\n[yellow]⚠ Received {sig_name} - Initiating graceful shutdown...[/yellow]")
-    shutdown_requested = True
+    
+    # Wake any waiter immediately instead of waiting for a poll tick
+    ctx.loop.call_soon_threadsafe(ctx.shutdown_event.set)
 
 
-def setup_signal_handlers():
-    """Set up signal handlers for graceful shutdown."""
-    signal.signal(signal.SIGINT, signal_handler)
-    signal.signal(signal.SIGTERM, signal_handler)
+def setup_signal_handlers(ctx: AppContext):
+    """
+    Set up signal handlers for graceful shutdown.
+    
+    Handlers are registered on the event loop so they run as loop callbacks;
+    Windows loops don't support that, so fall back to signal.signal there.
+    
+    Args:
+        ctx: AppContext whose shutdown_event the handlers set
+    """
+    signals = [signal.SIGINT, signal.SIGTERM]
     
     # Windows doesn't have SIGHUP
     if hasattr(signal, 'SIGHUP'):
-        signal.signal(signal.SIGHUP, signal_handler)
+        signals.append(signal.SIGHUP)
+    
+    for sig in signals:
+        try:
+            ctx.loop.add_signal_handler(sig, signal_handler, ctx, sig, None)
+        except (NotImplementedError, RuntimeError):
+            signal.signal(sig, functools.partial(signal_handler, ctx))
+
+
+@dataclass(frozen=True, slots=True)
+class BotConfig:
+    """Immutable bot configuration, coerced to final types once at startup."""
+    api_key: str
+    secret_key: str
+    risk_percent: Decimal
+    leverage: int
+    margin_mode: str
+    stoploss_percent: Decimal
+    max_position_percent: Decimal
+    max_concurrent_positions: int
+    base_symbol_limit: int
+    max_symbol_limit: int
+    testnet: bool
+    symbol: str
+    scan_interval: int  # seconds
+    tp_timeout_seconds: int
+    enable_dynamic_risk: bool
+    min_leverage: int
+    max_leverage: int
+    # Take Profit settings (0 = disabled)
+    takeprofit_percent: Decimal
+    # Trailing Stop settings (0 = disabled)
+    trailing_activation_percent: Decimal
+    trailing_callback_percent: Decimal
+    trailing_min_move_percent: Decimal
+    # Display settings (false = one-line logs instead of Rich panels)
+    verbose: bool
+    # Websocket user data stream (only re-fetch positions/orders on account events)
+    enable_user_stream: bool
+    
+    def __post_init__(self):
+        """Validate ranges up front so bad config fails before any order is placed."""
+        if not (0 < self.risk_percent <= 100):
+            raise ValueError(f"RISK_PERCENT must be in (0, 100], got {self.risk_percent}")
+        if self.leverage < 1:
+            raise ValueError(f"LEVERAGE must be >= 1, got {self.leverage}")
+        if not (1 <= self.min_leverage <= self.max_leverage):
+            raise ValueError(
+                f"MIN_LEVERAGE ({self.min_leverage}) must be >= 1 and <= MAX_LEVERAGE ({self.max_leverage})"
+            )
+        if self.margin_mode not in ('isolated', 'cross'):
+            raise ValueError(f"MARGIN_MODE must be 'isolated' or 'cross', got '{self.margin_mode}'")
+        if not (0 < self.stoploss_percent < 100):
+            raise ValueError(f"STOPLOSS_PERCENT must be in (0, 100), got {self.stoploss_percent}")
+        if not (0 < self.max_position_percent <= 100):
+            raise ValueError(f"MAX_POSITION_PERCENT must be in (0, 100], got {self.max_position_percent}")
+        if self.max_concurrent_positions < 1:
+            raise ValueError(f"MAX_CONCURRENT_POSITIONS must be >= 1, got {self.max_concurrent_positions}")
+        if not (0 < self.base_symbol_limit <= self.max_symbol_limit):
+            raise ValueError(
+                f"BASE_SYMBOL_LIMIT ({self.base_symbol_limit}) must be > 0 and <= "
+                f"MAX_SYMBOL_LIMIT ({self.max_symbol_limit})"
+            )
+        if self.scan_interval <= 0:
+            raise ValueError(f"SCAN_INTERVAL must be > 0, got {self.scan_interval}")
+        if self.tp_timeout_seconds < 0:
+            raise ValueError(f"TP_TIMEOUT_SECONDS must be >= 0, got {self.tp_timeout_seconds}")
+        if self.takeprofit_percent < 0:
+            raise ValueError(f"TAKEPROFIT_PERCENT must be >= 0, got {self.takeprofit_percent}")
+        if self.trailing_activation_percent < 0 or self.trailing_callback_percent < 0:
+            raise ValueError("TRAILING_ACTIVATION_PERCENT and TRAILING_CALLBACK_PERCENT must be >= 0")
+        if self.trailing_min_move_percent < 0:
+            raise ValueError(f"TRAILING_MIN_MOVE_PERCENT must be >= 0, got {self.trailing_min_move_percent}")
+
+
+def _env_decimal(name: str, default: str) -> Decimal:
+    """Parse a numeric env var straight from its string (ValueError on bad input, like float())."""
+    raw = os.getenv(name, default).strip()
+    try:
+        value = Decimal(raw)
+    except InvalidOperation:
+        raise ValueError(f"{name} must be a number, got '{raw}'")
+    if not value.is_finite():
+        raise ValueError(f"{name} must be finite, got '{raw}'")
+    return value
 
 
-def load_config() -> dict:
+@functools.lru_cache(maxsize=1)
+def load_config() -> BotConfig:
     """
     Load configuration from environment variables.
     
+    The result is cached; call load_config.cache_clear() to force a re-read.
+    
     Returns:
-        Configuration dictionary
+        BotConfig instance
         
     Raises:
-        ValueError: If required config is missing
+        ValueError: If required config is missing or out of range
     """
-    # Load .env file
-    env_path = Path(__file__).parent / '.env'
-    load_dotenv(env_path)
+    # .env was already loaded at import time (before the other modules)
     
     # Required variables
     api_key = os.getenv('API_KEY')
@@ -89,78 +228,167 @@ def load_config() -> dict:
         raise ValueError("API_KEY and SECRET_KEY must be set in .env file")
     
     # Optional variables with defaults
-    config = {
-        'api_key': api_key,
-        'secret_key': secret_key,
-        'risk_percent': float(os.getenv('RISK_PERCENT', '1.0')),
-        'leverage': int(os.getenv('LEVERAGE', '10')),
-        'margin_mode': os.getenv('MARGIN_MODE', 'isolated').lower(),
-        'stoploss_percent': float(os.getenv('STOPLOSS_PERCENT', '2.0')),
-        'max_position_percent': float(os.getenv('MAX_POSITION_PERCENT', '10.0')),
-        'max_concurrent_positions': int(os.getenv('MAX_CONCURRENT_POSITIONS', '5')),
-        'base_symbol_limit': int(os.getenv('BASE_SYMBOL_LIMIT', '15')),
-        'max_symbol_limit': int(os.getenv('MAX_SYMBOL_LIMIT', '50')),
-        'testnet': os.getenv('TESTNET', 'false').lower() == 'true',
-        'symbol': os.getenv('SYMBOL', 'BTC/USDT'),
-        'scan_interval': int(os.getenv('SCAN_INTERVAL', '60')),  # seconds
-        'tp_timeout_seconds': int(os.getenv('TP_TIMEOUT_SECONDS', '30')),
-        'enable_dynamic_risk': os.getenv('ENABLE_DYNAMIC_RISK', 'false').lower() == 'true',
-        # Take Profit settings (0 = disabled)
-        'takeprofit_percent': float(os.getenv('TAKEPROFIT_PERCENT', '0')),
-        # Trailing Stop settings (0 = disabled)
-        'trailing_activation_percent': float(os.getenv('TRAILING_ACTIVATION_PERCENT', '0')),
-        'trailing_callback_percent': float(os.getenv('TRAILING_CALLBACK_PERCENT', '0.5')),
-    }
-    
-    return config
-
-
-async def cleanup():
-    """Clean up resources on shutdown."""
-    global exchange, lock
+    return BotConfig(
+        api_key=api_key,
+        secret_key=secret_key,
+        risk_percent=_env_decimal('RISK_PERCENT', '1.0'),
+        leverage=int(os.getenv('LEVERAGE', '10')),
+        margin_mode=os.getenv('MARGIN_MODE', 'isolated').lower(),
+        stoploss_percent=_env_decimal('STOPLOSS_PERCENT', '2.0'),
+        max_position_percent=_env_decimal('MAX_POSITION_PERCENT', '10.0'),
+        max_concurrent_positions=int(os.getenv('MAX_CONCURRENT_POSITIONS', '5')),
+        base_symbol_limit=int(os.getenv('BASE_SYMBOL_LIMIT', '15')),
+        max_symbol_limit=int(os.getenv('MAX_SYMBOL_LIMIT', '50')),
+        testnet=os.getenv('TESTNET', 'false').lower() == 'true',
+        symbol=os.getenv('SYMBOL', 'BTC/USDT'),
+        scan_interval=int(os.getenv('SCAN_INTERVAL', '60')),
+        tp_timeout_seconds=int(os.getenv('TP_TIMEOUT_SECONDS', '30')),
+        enable_dynamic_risk=os.getenv('ENABLE_DYNAMIC_RISK', 'false').lower() == 'true',
+        min_leverage=int(os.getenv('MIN_LEVERAGE', '3')),
+        max_leverage=int(os.getenv('MAX_LEVERAGE', '20')),
+        takeprofit_percent=_env_decimal('TAKEPROFIT_PERCENT', '0'),
+        trailing_activation_percent=_env_decimal('TRAILING_ACTIVATION_PERCENT', '0'),
+        trailing_callback_percent=_env_decimal('TRAILING_CALLBACK_PERCENT', '0.5'),
+        trailing_min_move_percent=_env_decimal('TRAILING_MIN_MOVE_PERCENT', '0.05'),
+        verbose=os.getenv('VERBOSE', 'true').lower() == 'true',
+        enable_user_stream=os.getenv('ENABLE_USER_STREAM', 'false').lower() == 'true',
+    )
+
+
+async def prefetch_iteration_data(
+    exchange: SafeExchange,
+    delay: float,
+    include_positions: bool = True
+) -> Tuple[Optional[list], Optional[list], dict]:
+    """
+    Fetch the data the next iteration starts with, shortly before it starts.
+    
+    Sleeps most of the scan interval first so the snapshot is only
+    PREFETCH_LEAD_SECONDS old when used (positions must not go stale).
+    
+    Args:
+        exchange: SafeExchange instance
+        delay: Seconds to wait before fetching
+        include_positions: Also fetch positions/orders (False when the
+            user data stream already provides them)
+        
+    Returns:
+        Tuple of (positions, open_orders, tickers); positions/orders are
+        None when not included
+    """
+    await asyncio.sleep(delay)
+    
+    if not include_positions:
+        return None, None, await exchange.fetch_tickers()
+    
+    return await asyncio.gather(
+        exchange.fetch_positions(),
+        exchange.fetch_open_orders(),
+        exchange.fetch_tickers()
+    )
+
+
+async def wait_for_shutdown(shutdown_event: asyncio.Event, timeout: float) -> bool:
+    """
+    Sleep up to timeout seconds, waking immediately on shutdown.
+    
+    Args:
+        shutdown_event: Event set by the signal handlers
+        timeout: Max seconds to wait
+        
+    Returns:
+        True if shutdown was requested
+    """
+    try:
+        await asyncio.wait_for(shutdown_event.wait(), timeout=timeout)
+    except asyncio.TimeoutError:
+        pass
+    return shutdown_event.is_set()
+
+
+async def fetch_account_snapshot(
+    exchange: SafeExchange,
+    user_stream: Optional[UserDataStream] = None
+) -> Tuple[list, list]:
+    """
+    Fetch positions and open orders concurrently.
+    
+    Args:
+        exchange: SafeExchange instance
+        user_stream: Served from its cache when nothing changed (optional)
+        
+    Returns:
+        Tuple of (positions, open_orders)
+    """
+    if user_stream:
+        return await user_stream.snapshot()
+    
+    positions, open_orders = await asyncio.gather(
+        exchange.fetch_positions(),
+        exchange.fetch_open_orders()
+    )
+    return positions, open_orders
+
+
+async def cleanup(ctx: AppContext):
+    """
+    Clean up resources on shutdown.
     
+    Args:
+        ctx: AppContext holding the resources to release
+    """
     console.print("\n[cyan]Cleaning up...[/cyan]")
     
-    if exchange:
+    if ctx.user_stream:
+        try:
+            await ctx.user_stream.stop()
+        except Exception as e:
+            console.print(f"[red]Error stopping user data stream: {e}[/red]")
+        ctx.user_stream = None
+    
+    if ctx.exchange:
         try:
-            await exchange.disconnect()
+            await ctx.exchange.disconnect()
         except Exception as e:
             console.print(f"[red]Error disconnecting exchange: {e}[/red]")
     
-    if lock:
-        lock.release()
+    if ctx.lock:
+        ctx.lock.release()
     
     console.print("[green]✓ Cleanup complete[/green]")
 
 
-async def trading_loop(
-    exchange: SafeExchange,
-    config: dict
-):
+async def trading_loop(ctx: AppContext):
     """
     Main trading loop with Trailing Stop support.
     
     Args:
-        exchange: SafeExchange instance
-        config: Configuration dictionary
+        ctx: AppContext with connected exchange and loaded config
     """
-    global shutdown_requested
-    
-    risk_percent = Decimal(str(config['risk_percent']))
-    leverage = config['leverage']
-    margin_mode = config['margin_mode']
-    stoploss_percent = Decimal(str(config['stoploss_percent']))
-    max_position_percent = Decimal(str(config['max_position_percent']))
-    max_concurrent_positions = config['max_concurrent_positions']
-    base_symbol_limit = config['base_symbol_limit']
-    max_symbol_limit = config['max_symbol_limit']
-    takeprofit_percent = Decimal(str(config['takeprofit_percent']))
-    trailing_activation = Decimal(str(config['trailing_activation_percent']))
-    trailing_callback = Decimal(str(config['trailing_callback_percent']))
-    scan_interval = config['scan_interval']
+    exchange = ctx.exchange
+    config = ctx.config
+    shutdown_event = ctx.shutdown_event
+    
+    risk_percent = config.risk_percent
+    leverage = config.leverage
+    margin_mode = config.margin_mode
+    stoploss_percent = config.stoploss_percent
+    max_position_percent = config.max_position_percent
+    max_concurrent_positions = config.max_concurrent_positions
+    base_symbol_limit = config.base_symbol_limit
+    max_symbol_limit = config.max_symbol_limit
+    takeprofit_percent = config.takeprofit_percent
+    trailing_activation = config.trailing_activation_percent
+    trailing_callback = config.trailing_callback_percent
+    scan_interval = config.scan_interval
+    verbose = config.verbose
     
     # Calculate per-position margin limit
-    per_position_percent = max_position_percent / Decimal(str(max_concurrent_positions))
+    per_position_percent = max_position_percent / Decimal(max_concurrent_positions)
+    
+    # Take profit multipliers are config-derived - compute once
+    tp_long_mult = DEC_ONE + takeprofit_percent / DEC_HUNDRED
+    tp_short_mult = DEC_ONE - takeprofit_percent / DEC_HUNDRED
     
     console.print(f"[cyan]Portfolio Settings:[/cyan]")
     console.print(f"  Max Concurrent Positions: {max_concurrent_positions}")
@@ -168,8 +396,8 @@ async def trading_loop(
     console.print(f"  Per-Position Limit: {per_position_percent}%")
     console.print(f"  Margin Mode: {margin_mode.upper()}")
     console.print(f"  Leverage: {leverage}x")
-    console.print(f"  TP Timeout: {config['tp_timeout_seconds']}s (force close if TP reached but not filled)")
-    console.print(f"  Dynamic Risk: {'ENABLED' if config['enable_dynamic_risk'] else 'DISABLED'}")
+    console.print(f"  TP Timeout: {config.tp_timeout_seconds}s (force close if TP reached but not filled)")
+    console.print(f"  Dynamic Risk: {'ENABLED' if config.enable_dynamic_risk else 'DISABLED'}")
     console.print(f"[cyan]Scanner Settings:[/cyan]")
     console.print(f"  Base Symbols: {base_symbol_limit}")
     console.print(f"  Max Symbols: {max_symbol_limit} (progressive)")
@@ -182,65 +410,235 @@ async def trading_loop(
             trailing_activation_percent=trailing_activation,
             trailing_callback_percent=trailing_callback,
             stoploss_percent=stoploss_percent,
-            tp_timeout_seconds=config['tp_timeout_seconds']
+            tp_timeout_seconds=config.tp_timeout_seconds,
+            verbose=verbose,
+            min_sl_move_percent=config.trailing_min_move_percent
         )
         console.print(f"[green]✓ Trailing Stop enabled: Activation={trailing_activation}%, Callback={trailing_callback}%[/green]")
     
     # Initialize Dynamic Risk Manager
     risk_manager = DynamicRiskManager(
         base_leverage=leverage,
-        min_leverage=int(os.getenv('MIN_LEVERAGE', '3')),
-        max_leverage=int(os.getenv('MAX_LEVERAGE', '20')),
-        enabled=config['enable_dynamic_risk']
+        min_leverage=config.min_leverage,
+        max_leverage=config.max_leverage,
+        enabled=config.enable_dynamic_risk
     )
     
+    # Start websocket user data stream (Optional)
+    if config.enable_user_stream:
+        ctx.user_stream = UserDataStream(exchange)
+        await ctx.user_stream.start()
+        console.print("[green]✓ User data stream enabled (REST refresh only on account events)[/green]")
+    
     # Initialize Notification System (Optional)
-    global notifier
+    user_stream = ctx.user_stream
+    
     notifier = Notifier()
+    ctx.notifier = notifier
     set_notifier(notifier)
     
     # Send startup notification
     if notifier.is_enabled():
         try:
+            balance = await exchange.get_usdt_free()
             await notifier.send_startup(
                 balance=float(balance),
-                testnet=config.get('testnet', False)
+                testnet=config.testnet
             )
         except Exception as e:
             console.print(f"[yellow]⚠ Failed to send startup notification: {e}[/yellow]")
     
     iteration = 0
     symbols = []  # Will be fetched dynamically
-    base_symbol_limit = 15  # Default scan size
+    last_summary_fingerprint: Optional[int] = None  # Skip re-rendering unchanged summaries
+    last_next_scan_log: Optional[float] = None  # Throttles the "Next scan" line when not verbose
+    
+    # Progressive scanning: base_symbol_limit → max_symbol_limit
+    # BUT enter positions IMMEDIATELY when found (don't wait for full scan)
+    step_size = 5
+    scan_limits = list(range(base_symbol_limit, max_symbol_limit + 1, step_size))
+    if not scan_limits or scan_limits[-1] != max_symbol_limit:
+        scan_limits.append(max_symbol_limit)
+    scan_limits = tuple(scan_limits)
+    
+    loop = asyncio.get_running_loop()
+    
+    # Data for the next iteration, fetched at the tail of the scan_interval wait
+    prefetch_task: Optional[asyncio.Task] = None
+
+    # Caps simultaneous order placement (Binance order rate limits)
+    entry_semaphore = asyncio.Semaphore(MAX_PARALLEL_ENTRIES)
+    
+    async def enter_position(
+        semaphore: asyncio.Semaphore,
+        signal,
+        market_info: Dict,
+        usdt_balance: Decimal
+    ) -> Tuple[object, Optional[Dict]]:
+        """
+        Size and atomically enter one signal.
+        
+        Args:
+            semaphore: Concurrency gate for order placement
+            signal: Signal to enter
+            market_info: Market info for signal.symbol
+            usdt_balance: Free USDT balance shared by the batch
+            
+        Returns:
+            Tuple of (signal, execute_atomic_entry result or None if skipped/failed)
+        """
+        async with semaphore:
+            # Calculate take profit price if enabled
+            tp_price = None
+            if takeprofit_percent > 0:
+                tp_price = signal.entry_price * (tp_long_mult if signal.direction == 'LONG' else tp_short_mult)
+            
+            console.log(f"[green]Entering {signal.direction} {signal.symbol} @ {signal.entry_price} (SL {signal.stoploss_price}, TP {tp_price or '-'})[/green]")
+            
+            # Calculate position size with per-position limit. Errors are handled
+            # here: this runs as one task of a batch and must never escape it
+            try:
+                quantity = calculate_safe_quantity(
+                    balance=usdt_balance,
+                    risk_percent=risk_percent,
+                    entry_price=signal.entry_price,
+                    stoploss_price=signal.stoploss_price,
+                    exchange_info=market_info,
+                    symbol=signal.symbol,
+                    leverage=leverage,
+                    max_position_percent=per_position_percent  # Use divided amount
+                )
+            except Exception as e:
+                console.log(f"[red]✗ Position sizing failed for {signal.symbol}: {e}[/red]")
+                return signal, None
+            
+            if quantity == 0:
+                console.print(f"[yellow]⚠ Calculated quantity is 0 for {signal.symbol} - skipping[/yellow]")
+                return signal, None
+            
+            # Execute atomic entry
+            side = 'buy' if signal.direction == 'LONG' else 'sell'
+            
+            try:
+                result = await execute_atomic_entry(
+                    exchange=exchange,
+                    symbol=signal.symbol,
+                    side=side,
+                    quantity=quantity,
+                    stoploss_price=signal.stoploss_price,
+                    takeprofit_price=tp_price,  # Optional TP
+                    leverage=leverage,  # Pass leverage to set per-position
+                    margin_mode=margin_mode  # Pass margin mode (isolated/cross)
+                )
+            except SpreadTooWideError as e:
+                console.log(f"[yellow]⚠ Trade aborted for {signal.symbol}: {e}[/yellow]")
+                return signal, None
+            except StaleDataError as e:
+                console.log(f"[red]✗ Stale data for {signal.symbol}: {e}[/red]")
+                return signal, None
+            except ExchangeError as e:
+                console.log(f"[red]✗ Exchange error for {signal.symbol}: {e}[/red]")
+                return signal, None
+            except Exception as e:
+                console.log(f"[red]✗ Entry failed for {signal.symbol}: {e}[/red]")
+                return signal, None
+            
+            if result['success'] and not verbose:
+                console.log(f"[green]✓ Executed {signal.symbol}: {result['executed_qty']} @ {result['average_price']}[/green]")
+            
+            return signal, result
     
-    while not shutdown_requested:
+    while not shutdown_event.is_set():
         iteration += 1
         
-        console.print(Panel(
-            f"[bold cyan]TRADING LOOP - Iteration {iteration}[/bold cyan]",
-            border_style="cyan"
-        ))
+        # Deadline-based cadence: next scan is scan_interval after this one STARTED
+        next_scan_at = loop.time() + scan_interval
+        
+        if verbose or iteration % HEADER_PANEL_EVERY == 0:
+            console.print(Panel(
+                f"[bold cyan]TRADING LOOP - Iteration {iteration}[/bold cyan]",
+                border_style="cyan"
+            ))
+        else:
+            console.log(f"iter={iteration}")
         
         try:
-            # ====== STEP 0: UPDATE SYMBOL WATCHLIST (Every iteration for real-time volume) ======
+            # Pick up data prefetched during the previous wait (if any)
+            prefetched_positions = prefetched_orders = prefetched_tickers = None
+            if prefetch_task is not None:
+                try:
+                    prefetched_positions, prefetched_orders, prefetched_tickers = await prefetch_task
+                except Exception as e:
+                    console.print(f"[dim]Prefetch failed ({e}) - fetching fresh data[/dim]")
+                prefetch_task = None
+            
+            # ====== STEP 0: UPDATE SYMBOL WATCHLIST (volume ranking cached for a short TTL) ======
+            # Watchlist, market metadata refresh (TTL-gated) and the account
+            # snapshot hit independent endpoints - fetch them concurrently
             console.print("[dim]Updating symbol watchlist...[/dim]")
-            symbols = await fetch_top_symbols(exchange, limit=base_symbol_limit)
+            need_snapshot = user_stream is not None or prefetched_positions is None
+            results = await asyncio.gather(
+                fetch_top_symbols(exchange, limit=base_symbol_limit),
+                exchange.refresh_markets(),
+                *([fetch_account_snapshot(exchange, user_stream)] if need_snapshot else [])
+            )
+            
+            symbols = results[0]
             if not symbols:
                 console.print("[yellow]⚠ No symbols available - using fallback[/yellow]")
                 symbols = get_default_symbols()
             
+            # One positions/orders snapshot per iteration (stream cache > prefetch > REST)
+            if need_snapshot:
+                positions, open_orders = results[2]
+            else:
+                positions, open_orders = prefetched_positions, prefetched_orders
+            
             # ====== STEP 1: GHOST SYNCHRONIZER (SAFETY FIRST) ======
             # Pass None for symbol to check ALL positions/orders
-            sync_result = await ghost_synchronizer(exchange, stoploss_percent, None)
+            sync_result = await ghost_synchronizer(
+                exchange, stoploss_percent, None,
+                positions=positions,
+                open_orders=open_orders
+            )
+            
+            failed_symbols = sync_result['failed_symbols']
             
-            if sync_result['errors'] > 0:
+            if sync_result['errors'] > 0 and (
+                not failed_symbols or sync_result['unprotected_symbols']
+            ):
+                # Sync itself failed, or a position is naked - open no new risk
+                # until every position has a stop loss again
                 console.print("[yellow]⚠ Safety issues detected - skipping this iteration[/yellow]")
-                await asyncio.sleep(10)
+                await wait_for_shutdown(shutdown_event, 10)
                 continue
             
+            if failed_symbols:
+                # Only fixes on still-protected positions failed (e.g. an old SL
+                # couldn't be cancelled) - retried next cycle, trading continues
+                console.print(f"[yellow]⚠ SL fix pending on {', '.join(sorted(failed_symbols))} (positions still protected)[/yellow]")
+            
+            # Ghost sync replaced SL orders - refresh orders so later steps see them
+            if sync_result['missing_sl_fixed'] or sync_result['qty_mismatch_fixed']:
+                open_orders = await exchange.fetch_open_orders()
+                if user_stream:
+                    user_stream.invalidate()
+            
             # ====== STEP 2: DISPLAY CURRENT POSITIONS ======
-            summaries = await get_position_summary(exchange, None)
-            display_position_summary(summaries)
+            summaries = await get_position_summary(
+                exchange, None,
+                positions=positions,
+                open_orders=open_orders
+            )
+            
+            # Only re-render the summary table when positions/SLs changed
+            summary_fingerprint = hash(tuple(
+                (s['symbol'], str(s['quantity']), str(s.get('stop_loss_price')))
+                for s in summaries
+            ))
+            if summary_fingerprint != last_summary_fingerprint:
+                display_position_summary(summaries)
+                last_summary_fingerprint = summary_fingerprint
             
             # Extract active symbols to avoid duplicates
             active_symbols = set()
@@ -257,11 +655,7 @@ async def trading_loop(
             if summaries and position_manager:
                 console.print("\n[bold]Processing Trailing Stops...[/bold]")
                 
-                # Get positions and orders for trailing stop processing
-                positions = await exchange.fetch_positions()
-                open_orders = await exchange.fetch_open_orders()
-                
-                # Process trailing stops
+                # Process trailing stops (reuses this iteration's snapshot)
                 trailing_result = await position_manager.process_trailing_stops(
                     positions=positions,
                     open_orders=open_orders
@@ -269,26 +663,38 @@ async def trading_loop(
                 
                 # Display tracker status
                 position_manager.display_tracker_status()
+                
+                if user_stream and (trailing_result['stops_moved'] or trailing_result['tp_timeouts']):
+                    user_stream.invalidate()
+            
+            # Shutdown checkpoint: protective steps above always finish, but never
+            # start scanning or opening positions once shutdown was requested
+            if shutdown_event.is_set():
+                break
             
             # ====== STEP 4: CHECK IF WE CAN OPEN NEW POSITIONS ======
             if available_slots <= 0:
                 console.print("[dim]Portfolio full - waiting for positions to close...[/dim]")
-                await asyncio.sleep(min(scan_interval, 10))
+                await wait_for_shutdown(shutdown_event, min(scan_interval, 10))
                 continue
             
             # ====== STEP 5: SCAN AND ENTER POSITIONS IMMEDIATELY ======
             console.print(f"[cyan]Scanning for signals to fill {available_slots} slot(s)...[/cyan]")
             
-            # Progressive scanning: base_symbol_limit → max_symbol_limit
-            # BUT enter positions IMMEDIATELY when found (don't wait for full scan)
-            step_size = 5
-            scan_limits = list(range(base_symbol_limit, max_symbol_limit + 1, step_size))
-            if scan_limits[-1] != max_symbol_limit:
-                scan_limits.append(max_symbol_limit)
-            
             positions_entered = 0
             
+            # Free USDT, fetched lazily once and then tracked locally across entries
+            usdt_balance: Optional[Decimal] = None
+            
+            # One batch ticker snapshot for every volume filter in this scan
+            tickers = prefetched_tickers or await exchange.fetch_tickers()
+            
+            scanned_symbols = set()
+            
             for scan_limit in scan_limits:
+                if shutdown_event.is_set():
+                    break
+                
                 # Stop if we've filled all slots
                 if positions_entered >= available_slots:
                     console.print(f"[green]✓ All {available_slots} slots filled - stopping scan[/green]")
@@ -299,18 +705,27 @@ async def trading_loop(
                     console.print(f"[dim]Expanding scan to top {scan_limit} symbols...[/dim]")
                     symbols = await fetch_top_symbols(exchange, limit=scan_limit)
                 
+                # Only analyze symbols this iteration's earlier passes haven't covered;
+                # their signals were already entered, excluded or attempted
+                new_symbols = [s for s in symbols[:scan_limit] if s not in scanned_symbols]
+                if not new_symbols:
+                    continue
+                scanned_symbols.update(new_symbols)
+                
                 # Scan for signals
                 signals = await scan_market(
                     exchange=exchange,
-                    symbols=symbols,
+                    symbols=new_symbols,
                     stoploss_percent=stoploss_percent,
-                    max_signals=available_slots - positions_entered + 5  # Only need remaining slots
+                    max_signals=available_slots - positions_entered + 5,  # Only need remaining slots
+                    tickers=tickers,
+                    verbose=verbose
                 )
                 
                 if not signals:
                     continue
                 
-                # Filter out symbols already in portfolio
+                # Filter out symbols already in portfolio (one set lookup per signal)
                 filtered_signals = [s for s in signals if s.symbol not in active_symbols]
                 
                 if not filtered_signals:
@@ -319,107 +734,88 @@ async def trading_loop(
                 console.print(f"[green]Found {len(filtered_signals)} signal(s) at {scan_limit} symbols - entering positions NOW[/green]")
                 
                 # ====== STEP 6: ENTER POSITIONS IMMEDIATELY ======
+                candidates = []
+                market_infos = {}
                 for signal in filtered_signals:
-                    # Stop if we've filled all slots
-                    if positions_entered >= available_slots:
-                        break
-                    
-                    # Calculate take profit price if enabled
-                    tp_price = None
-                    if takeprofit_percent > 0:
-                        if signal.direction == 'LONG':
-                            tp_price = signal.entry_price * (Decimal("1") + takeprofit_percent / Decimal("100"))
-                        else:
-                            tp_price = signal.entry_price * (Decimal("1") - takeprofit_percent / Decimal("100"))
-                    
-                    tp_info = f"\nTake Profit: {tp_price}" if tp_price else ""
-                    trailing_info = f"\nTrailing: Activation={trailing_activation}%, Callback={trailing_callback}%" if trailing_activation > 0 else ""
-                    
-                    console.print(Panel(
-                        f"[bold green]SIGNAL #{positions_entered + 1}[/bold green]\n"
-                        f"Symbol: {signal.symbol}\n"
-                        f"Direction: {signal.direction}\n"
-                        f"Entry: {signal.entry_price}\n"
-                        f"Stop Loss: {signal.stoploss_price}{tp_info}{trailing_info}\n"
-                        f"Reason: {signal.reason}",
-                        title="📈 ENTERING POSITION NOW",
-                        border_style="green"
-                    ))
-                    
                     # Validate entry price (skip if 0 or invalid)
                     if signal.entry_price <= 0:
                         console.print(f"[red]✗ Invalid entry price ({signal.entry_price}) for {signal.symbol} - skipping[/red]")
                         continue
                     
-                    # Get balance
-                    balance_info = await exchange.fetch_balance()
-                    usdt_balance = Decimal(str(balance_info.get('USDT', {}).get('free', 0)))
-                    
-                    if usdt_balance <= 0:
-                        console.print("[red]✗ Insufficient balance - stopping entry[/red]")
-                        break
-                    
-                    # Calculate position size with per-position limit
-                    market_info = exchange.get_market_info(signal.symbol)
-                    
-                    quantity = calculate_safe_quantity(
-                        balance=usdt_balance,
-                        risk_percent=risk_percent,
-                        entry_price=signal.entry_price,
-                        stoploss_price=signal.stoploss_price,
-                        exchange_info=market_info,
-                        symbol=signal.symbol,
-                        leverage=leverage,
-                        max_position_percent=per_position_percent  # Use divided amount
-                    )
-                    
-                    if quantity == 0:
-                        console.print(f"[yellow]⚠ Calculated quantity is 0 for {signal.symbol} - skipping[/yellow]")
+                    # Resolve market info up front so unknown symbols never take a slot
+                    try:
+                        market_infos[signal.symbol] = exchange.get_market_info(signal.symbol)
+                    except ExchangeError as e:
+                        console.print(f"[red]✗ {e} - skipping[/red]")
                         continue
+                    candidates.append(signal)
+                
+                if not candidates:
+                    continue
+                
+                if usdt_balance is None:
+                    usdt_balance = await exchange.get_usdt_free()
+                
+                if usdt_balance <= 0:
+                    console.print("[red]✗ Insufficient balance - stopping entry[/red]")
+                    break
+                
+                # Enter remaining slots concurrently; failed candidates make room for the next ones
+                while candidates and positions_entered < available_slots and not shutdown_event.is_set():
+                    batch = candidates[:available_slots - positions_entered]
+                    candidates = candidates[len(batch):]
                     
-                    # Execute atomic entry
-                    side = 'buy' if signal.direction == 'LONG' else 'sell'
+                    entry_tasks = [
+                        asyncio.create_task(enter_position(
+                            entry_semaphore, signal, market_infos[signal.symbol], usdt_balance
+                        ))
+                        for signal in batch
+                    ]
                     
-                    try:
-                        result = await execute_atomic_entry(
-                            exchange=exchange,
-                            symbol=signal.symbol,
-                            side=side,
-                            quantity=quantity,
-                            stoploss_price=signal.stoploss_price,
-                            takeprofit_price=tp_price,  # Optional TP
-                            leverage=leverage,  # Pass leverage to set per-position
-                            margin_mode=margin_mode  # Pass margin mode (isolated/cross)
-                        )
-                        
-                        if result['success']:
-                            tp_order_info = ""
-                            if result.get('take_profit_order'):
-                                tp_order_info = f"\nTake Profit: {result['take_profit_order']['id']}"
-                            
-                            console.print(Panel(
-                                f"[bold green]TRADE EXECUTED[/bold green]\n"
-                                f"Symbol: {signal.symbol}\n"
-                                f"Entry: {result['entry_order']['id']}\n"
-                                f"Stop Loss: {result['stop_loss_order']['id']}{tp_order_info}\n"
-                                f"Executed: {result['executed_qty']} @ {result['average_price']}",
-                                title="✅ SUCCESS",
-                                border_style="green"
-                            ))
+                    # Verbose: one in-place table for the batch instead of a Panel per signal
+                    entry_table = Table(title="📈 Entries")
+                    entry_table.add_column("Symbol", style="cyan")
+                    entry_table.add_column("Direction")
+                    entry_table.add_column("Entry", justify="right")
+                    entry_table.add_column("Stop Loss", justify="right", style="red")
+                    entry_table.add_column("Result")
+                    live = Live(entry_table, console=console, refresh_per_second=4) if verbose else contextlib.nullcontext()
+                    
+                    entry_failed = False
+                    with live:
+                        for next_entry in asyncio.as_completed(entry_tasks):
+                            signal, result = await next_entry
                             
-                            # Track successful entry
-                            positions_entered += 1
-                            active_symbols.add(signal.symbol)
+                            if result and result['success']:
+                                # Track successful entry
+                                positions_entered += 1
+                                active_symbols.add(signal.symbol)
+                                
+                                # Deduct the margin this entry locked up instead of refetching
+                                usdt_balance -= result['executed_qty'] * result['average_price'] / leverage
+                                status = f"[green]✓ {result['executed_qty']} @ {result['average_price']}[/green]"
+                            else:
+                                entry_failed = True
+                                status = "[red]✗ not entered[/red]"
                             
-                    except SpreadTooWideError as e:
-                        console.print(f"[yellow]⚠ Trade aborted for {signal.symbol}: {e}[/yellow]")
-                    except StaleDataError as e:
-                        console.print(f"[red]✗ Stale data for {signal.symbol}: {e}[/red]")
-                    except ExchangeError as e:
-                        console.print(f"[red]✗ Exchange error for {signal.symbol}: {e}[/red]")
+                            dir_color = "green" if signal.direction == 'LONG' else "red"
+                            entry_table.add_row(
+                                signal.symbol,
+                                f"[{dir_color}]{signal.direction}[/{dir_color}]",
+                                str(signal.entry_price),
+                                str(signal.stoploss_price),
+                                status
+                            )
+                    
+                    # A failed entry may mean our estimate drifted (e.g. insufficient margin) - refetch
+                    if entry_failed and candidates:
+                        usdt_balance = await exchange.get_usdt_free()
+                    
+                    if user_stream:
+                        user_stream.invalidate()
                     
-                    # Small delay between entries
-                    await asyncio.sleep(1)
+                    if usdt_balance <= 0:
+                        break
             
             # If we didn't enter any positions in this iteration, wait before next scan
             if positions_entered == 0:
@@ -429,23 +825,38 @@ async def trading_loop(
         
         except Exception as e:
             console.print(f"[red]✗ Unexpected error in trading loop: {e}[/red]")
-            import traceback
+            invalidate_symbol_cache()
             console.print(f"[dim]{traceback.format_exc()}[/dim]")
         
         # Wait before next iteration
-        if not shutdown_requested:
-            console.print(f"\n[dim]Next scan in {scan_interval} seconds...[/dim]")
+        if not shutdown_event.is_set():
+            wait_seconds = max(0.0, next_scan_at - loop.time())
+            now = loop.time()
+            if verbose or last_next_scan_log is None or now - last_next_scan_log >= NEXT_SCAN_LOG_INTERVAL:
+                console.print(f"\n[dim]Next scan in {wait_seconds:.0f} seconds...[/dim]")
+                last_next_scan_log = now
             
-            # Use shorter sleep intervals to respond to shutdown quickly
-            for _ in range(scan_interval):
-                if shutdown_requested:
-                    break
-                await asyncio.sleep(1)
+            # Overlap the next iteration's REST round-trips with the idle wait
+            prefetch_task = asyncio.create_task(prefetch_iteration_data(
+                exchange,
+                max(0.0, wait_seconds - PREFETCH_LEAD_SECONDS),
+                include_positions=user_stream is None
+            ))
+            
+            # Sleep until the deadline or until shutdown is requested
+            await wait_for_shutdown(shutdown_event, wait_seconds)
+    
+    # Shutdown requested during the wait - drop the pending prefetch and let
+    # it unwind before cleanup() closes the exchange session under it
+    if prefetch_task is not None:
+        prefetch_task.cancel()
+        with contextlib.suppress(asyncio.CancelledError, Exception):
+            await prefetch_task
 
 
 async def main():
     """Main entry point."""
-    global lock, exchange
+    ctx = AppContext(asyncio.get_running_loop())
     
     console.print(Panel(
         "[bold cyan]GEMINI IMMORTAL TRADING BOT[/bold cyan]\n"
@@ -458,37 +869,38 @@ async def main():
         # Load configuration
         console.print("\n[bold]Loading configuration...[/bold]")
         config = load_config()
+        ctx.config = config
         
-        console.print(f"[dim]Risk: {config['risk_percent']}%[/dim]")
-        console.print(f"[dim]Leverage: {config['leverage']}x[/dim]")
-        console.print(f"[dim]Stop Loss: {config['stoploss_percent']}%[/dim]")
-        console.print(f"[dim]Take Profit: {config['takeprofit_percent']}% {'(enabled)' if config['takeprofit_percent'] > 0 else '(disabled)'}[/dim]")
-        console.print(f"[dim]Trailing: Activation={config['trailing_activation_percent']}%, Callback={config['trailing_callback_percent']}% {'(enabled)' if config['trailing_activation_percent'] > 0 else '(disabled)'}[/dim]")
-        console.print(f"[dim]Testnet: {config['testnet']}[/dim]")
+        console.print(f"[dim]Risk: {config.risk_percent}%[/dim]")
+        console.print(f"[dim]Leverage: {config.leverage}x[/dim]")
+        console.print(f"[dim]Stop Loss: {config.stoploss_percent}%[/dim]")
+        console.print(f"[dim]Take Profit: {config.takeprofit_percent}% {'(enabled)' if config.takeprofit_percent > 0 else '(disabled)'}[/dim]")
+        console.print(f"[dim]Trailing: Activation={config.trailing_activation_percent}%, Callback={config.trailing_callback_percent}% {'(enabled)' if config.trailing_activation_percent > 0 else '(disabled)'}[/dim]")
+        console.print(f"[dim]Testnet: {config.testnet}[/dim]")
         
         # Set up signal handlers
-        setup_signal_handlers()
+        setup_signal_handlers(ctx)
         
         # Create exchange connection
         console.print("\n[bold]Connecting to exchange...[/bold]")
-        exchange = create_exchange(
-            api_key=config['api_key'],
-            secret_key=config['secret_key'],
-            testnet=config['testnet']
+        ctx.exchange = create_exchange(
+            api_key=config.api_key,
+            secret_key=config.secret_key,
+            testnet=config.testnet
         )
-        await exchange.connect()
+        await ctx.exchange.connect()
         
         # Bootstrap system (safety checks + PID lock)
-        lock = await bootstrap_system(
-            exchange=exchange.exchange,  # Pass the raw CCXT exchange
-            risk_percent=config['risk_percent'],
-            leverage=config['leverage'],
-            symbol=config['symbol'],
-            margin_mode=config['margin_mode']
+        ctx.lock = await bootstrap_system(
+            exchange=ctx.exchange.exchange,  # Pass the raw CCXT exchange
+            risk_percent=float(config.risk_percent),
+            leverage=config.leverage,
+            symbol=config.symbol,
+            margin_mode=config.margin_mode
         )
         
         # Start trading loop
-        await trading_loop(exchange, config)
+        await trading_loop(ctx)
         
     except BootstrapError as e:
         console.print(Panel(
@@ -515,11 +927,10 @@ async def main():
             title="🚨 FATAL ERROR",
             border_style="red"
         ))
-        import traceback
         console.print(f"[dim]{traceback.format_exc()}[/dim]")
         
     finally:
-        await cleanup()
+        await cleanup(ctx)
         
         console.print(Panel(
             "[bold cyan]GEMINI IMMORTAL[/bold cyan]\n"
@@ -530,4 +941,10 @@ async def main():
 
 
 if __name__ == '__main__':
-    asyncio.run(main())
+    if UVLOOP_AVAILABLE and sys.version_info >= (3, 12):
+        # Event loop policies are deprecated from 3.14 - pass the factory directly
+        asyncio.run(main(), loop_factory=uvloop.new_event_loop)
+    else:
+        if UVLOOP_AVAILABLE:
+            asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+        asyncio.run(main())
@@ -15,9 +15,14 @@ RUN THIS WHEN SOMETHING GOES WRONG!
 
 import os
 import sys
+import json
 import time
+import threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from decimal import Decimal
+from typing import Optional
 
 from dotenv import load_dotenv
 import ccxt
@@ -29,6 +34,16 @@ console = Console()
 # Lock file path
 LOCK_FILE = Path(__file__).parent / "bot.lock"
 
+# Market snapshot written by the main bot (skips load_markets when fresh)
+MARKETS_SNAPSHOT_MAX_AGE = 24 * 60 * 60  # seconds
+
+# Graceful-exit window before escalating to SIGKILL, and how often to probe
+PROCESS_EXIT_GRACE_SECONDS = 3.0
+PROCESS_EXIT_POLL_SECONDS = 0.01
+
+# Max cancel / market close requests sent in parallel
+PANIC_CLOSE_WORKERS = 8
+
 
 def print_banner():
     """Print the panic banner."""
@@ -45,6 +60,28 @@ def print_banner():
     ))
 
 
+def wait_for_process_exit(pid: int, timeout: float) -> bool:
+    """
+    Wait for a (non-child) process to exit by probing it with signal 0.
+    
+    Args:
+        pid: Process ID
+        timeout: Max seconds to wait
+        
+    Returns:
+        True if the process exited within timeout
+    """
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            os.kill(pid, 0)
+        except OSError:
+            return True
+        if time.monotonic() >= deadline:
+            return False
+        time.sleep(PROCESS_EXIT_POLL_SECONDS)
+
+
 def kill_main_process() -> bool:
     """
     Kill the main bot process using PID from lock file.
@@ -67,20 +104,34 @@ def kill_main_process() -> bool:
         
         # Kill the process
         if sys.platform == "win32":
-            # Windows
+            # Windows (NOTE: os.kill(pid, 0) is NOT a probe here - it calls TerminateProcess)
             import ctypes
             
-            PROCESS_TERMINATE = 1
+            PROCESS_TERMINATE = 0x0001
+            SYNCHRONIZE = 0x00100000
+            WAIT_OBJECT_0 = 0
             kernel32 = ctypes.windll.kernel32
-            handle = kernel32.OpenProcess(PROCESS_TERMINATE, False, pid)
+            handle = kernel32.OpenProcess(PROCESS_TERMINATE | SYNCHRONIZE, False, pid)
             
-            if handle:
+            if handle and kernel32.WaitForSingleObject(handle, 0) == WAIT_OBJECT_0:
+                # Handle to an already-exited process - nothing to terminate
+                kernel32.CloseHandle(handle)
+                console.print(f"[yellow]⚠ Process {pid} already exited[/yellow]")
+            elif handle:
                 result = kernel32.TerminateProcess(handle, 1)
+                
+                # Block until the process has actually exited (or the grace period ends)
+                exited = result and kernel32.WaitForSingleObject(
+                    handle, int(PROCESS_EXIT_GRACE_SECONDS * 1000)
+                ) == WAIT_OBJECT_0
                 kernel32.CloseHandle(handle)
                 
-                if result:
+                if exited:
                     console.print(f"[green]✓ Process {pid} terminated[/green]")
                     return True
+                elif result:
+                    console.print(f"[yellow]⚠ Process {pid} still exiting after {PROCESS_EXIT_GRACE_SECONDS}s[/yellow]")
+                    return True
                 else:
                     console.print(f"[yellow]⚠ Could not terminate process {pid}[/yellow]")
             else:
@@ -90,18 +141,18 @@ def kill_main_process() -> bool:
             import signal as sig
             
             try:
-                # First try SIGTERM
+                # First try SIGTERM, returning as soon as the process is gone
                 os.kill(pid, sig.SIGTERM)
-                time.sleep(1)
                 
-                # Check if still running
-                try:
-                    os.kill(pid, 0)
-                    # Still running, use SIGKILL
+                if wait_for_process_exit(pid, PROCESS_EXIT_GRACE_SECONDS):
+                    console.print(f"[green]✓ Process {pid} terminated (SIGTERM)[/green]")
+                else:
+                    # Still running after the grace period, use SIGKILL
                     os.kill(pid, sig.SIGKILL)
+                    if not wait_for_process_exit(pid, PROCESS_EXIT_GRACE_SECONDS):
+                        console.print(f"[red]✗ Process {pid} still alive {PROCESS_EXIT_GRACE_SECONDS}s after SIGKILL - it may still be trading[/red]")
+                        return False
                     console.print(f"[green]✓ Process {pid} killed (SIGKILL)[/green]")
-                except OSError:
-                    console.print(f"[green]✓ Process {pid} terminated (SIGTERM)[/green]")
                 
                 return True
                 
@@ -134,14 +185,36 @@ def cancel_all_orders(exchange) -> int:
             console.print("[green]✓ No open orders to cancel[/green]")
             return 0
         
-        cancelled = 0
+        # One DELETE allOpenOrders per symbol instead of one request per order
+        orders_by_symbol = defaultdict(list)
         for order in orders:
+            orders_by_symbol[order['symbol']].append(order)
+        
+        get_worker = thread_local_exchange(exchange)
+        
+        def cancel_symbol(symbol: str, symbol_orders: list) -> int:
+            worker = get_worker()
             try:
-                exchange.cancel_order(order['id'], order['symbol'])
-                console.print(f"[green]✓ Cancelled: {order['id']} ({order['symbol']})[/green]")
-                cancelled += 1
+                worker.cancel_all_orders(symbol)
+                console.print(f"[green]✓ Cancelled {len(symbol_orders)} order(s) on {symbol}[/green]")
+                return len(symbol_orders)
             except Exception as e:
-                console.print(f"[red]✗ Failed to cancel {order['id']}: {e}[/red]")
+                console.print(f"[yellow]⚠ Batch cancel failed for {symbol}: {e} - cancelling one by one[/yellow]")
+            
+            count = 0
+            for order in symbol_orders:
+                try:
+                    worker.cancel_order(order['id'], symbol)
+                    console.print(f"[green]✓ Cancelled: {order['id']} ({symbol})[/green]")
+                    count += 1
+                except Exception as e:
+                    console.print(f"[red]✗ Failed to cancel {order['id']}: {e}[/red]")
+            return count
+        
+        # Cancel all symbols concurrently instead of one round-trip after another
+        max_workers = min(PANIC_CLOSE_WORKERS, len(orders_by_symbol))
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            cancelled = sum(pool.map(lambda item: cancel_symbol(*item), orders_by_symbol.items()))
         
         console.print(f"[green]✓ Cancelled {cancelled} order(s)[/green]")
         return cancelled
@@ -151,12 +224,63 @@ def cancel_all_orders(exchange) -> int:
         return 0
 
 
-def close_all_positions(exchange) -> int:
+def clone_exchange(exchange):
+    """
+    Create another sync client with the same credentials, mode and markets.
+    
+    Args:
+        exchange: Connected CCXT exchange instance
+        
+    Returns:
+        New CCXT exchange instance (markets copied, no extra load_markets call)
+    """
+    clone = type(exchange)({
+        'apiKey': exchange.apiKey,
+        'secret': exchange.secret,
+        'enableRateLimit': True,
+        'options': {
+            'defaultType': 'future',
+        }
+    })
+    
+    if exchange.isSandboxModeEnabled:
+        clone.set_sandbox_mode(True)
+    
+    clone.set_markets(exchange.markets, exchange.currencies)
+    return clone
+
+
+def thread_local_exchange(exchange):
+    """
+    Build a getter returning one cloned client per worker thread.
+    
+    Sync ccxt clients aren't safe to share between threads.
+    
+    Args:
+        exchange: Connected CCXT exchange instance
+        
+    Returns:
+        Callable returning the calling thread's exchange instance
+    """
+    thread_state = threading.local()
+    
+    def get_worker():
+        worker = getattr(thread_state, 'exchange', None)
+        if worker is None:
+            worker = clone_exchange(exchange)
+            thread_state.exchange = worker
+        return worker
+    
+    return get_worker
+
+
+def close_all_positions(exchange, positions: Optional[list] = None) -> int:
     """
     Close ALL open positions at market price.
     
     Args:
         exchange: CCXT exchange instance
+        positions: Already-fetched positions (fetched here if None)
         
     Returns:
         Number of positions closed
@@ -164,46 +288,57 @@ def close_all_positions(exchange) -> int:
     console.print("\n[bold red]Step 3: CLOSING ALL POSITIONS[/bold red]")
     
     try:
-        positions = exchange.fetch_positions()
+        if positions is None:
+            positions = exchange.fetch_positions()
         
-        # Filter to only positions with non-zero quantity
-        open_positions = [p for p in positions if float(p.get('contracts', 0)) != 0]
+        # Build close orders in one pass (only positions with non-zero quantity)
+        close_orders = []
+        for pos in positions:
+            contracts = float(pos.get('contracts') or 0)
+            if contracts == 0:
+                continue
+            
+            # Determine close side (ccxt reports contracts unsigned, so trust
+            # 'side' and only fall back to the sign when it is missing)
+            side = pos.get('side')
+            is_long = side.lower() == 'long' if side else contracts > 0
+            close_side = 'sell' if is_long else 'buy'
+            
+            close_orders.append((pos['symbol'], close_side, abs(contracts)))
         
-        if not open_positions:
+        if not close_orders:
             console.print("[green]✓ No open positions to close[/green]")
             return 0
         
+        # One ccxt client per worker thread (sync clients aren't safe to share)
+        get_worker = thread_local_exchange(exchange)
+        
+        def close_one(symbol: str, close_side: str, abs_qty: float) -> str:
+            worker = get_worker()
+            
+            console.print(f"[cyan]→ Closing {symbol}: {close_side} {abs_qty}[/cyan]")
+            
+            # Create market order to close
+            worker.create_order(
+                symbol=symbol,
+                type='market',
+                side=close_side,
+                amount=abs_qty,
+                params={'reduceOnly': True}
+            )
+            return symbol
+        
         closed = 0
-        for pos in open_positions:
-            try:
-                symbol = pos['symbol']
-                contracts = float(pos.get('contracts', 0))
-                side = pos.get('side', '')
-                
-                # Determine close side
-                if side.lower() == 'long' or contracts > 0:
-                    close_side = 'sell'
-                else:
-                    close_side = 'buy'
-                
-                abs_qty = abs(contracts)
-                
-                console.print(f"[cyan]→ Closing {symbol}: {close_side} {abs_qty}[/cyan]")
-                
-                # Create market order to close
-                exchange.create_order(
-                    symbol=symbol,
-                    type='market',
-                    side=close_side,
-                    amount=abs_qty,
-                    params={'reduceOnly': True}
-                )
-                
-                console.print(f"[green]✓ Closed: {symbol}[/green]")
-                closed += 1
-                
-            except Exception as e:
-                console.print(f"[red]✗ Failed to close {pos.get('symbol')}: {e}[/red]")
+        max_workers = min(PANIC_CLOSE_WORKERS, len(close_orders))
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            futures = {pool.submit(close_one, *order): order[0] for order in close_orders}
+            
+            for future in as_completed(futures):
+                try:
+                    console.print(f"[green]✓ Closed: {future.result()}[/green]")
+                    closed += 1
+                except Exception as e:
+                    console.print(f"[red]✗ Failed to close {futures[future]}: {e}[/red]")
         
         console.print(f"[green]✓ Closed {closed} position(s)[/green]")
         return closed
@@ -213,6 +348,37 @@ def close_all_positions(exchange) -> int:
         return 0
 
 
+def load_markets_fast(exchange, testnet: bool) -> None:
+    """
+    Load markets from the main bot's on-disk snapshot, falling back to REST.
+    
+    Args:
+        exchange: CCXT exchange instance
+        testnet: Whether the exchange is in testnet mode
+    """
+    try:
+        # Same path the bot writes to; imported here so a broken core
+        # package can never stop the kill switch (REST fallback below)
+        from core.exchange import markets_snapshot_path
+        snapshot = markets_snapshot_path(testnet)
+    except Exception as e:
+        console.print(f"[dim]Market snapshot path unavailable ({e}) - loading from exchange[/dim]")
+        exchange.load_markets()
+        return
+    
+    try:
+        if time.time() - snapshot.stat().st_mtime < MARKETS_SNAPSHOT_MAX_AGE:
+            exchange.set_markets(json.loads(snapshot.read_bytes()))
+            console.print(f"[dim]Loaded {len(exchange.markets)} markets from snapshot[/dim]")
+            return
+    except FileNotFoundError:
+        pass
+    except (OSError, ValueError) as e:
+        console.print(f"[dim]Market snapshot unusable ({e}) - loading from exchange[/dim]")
+    
+    exchange.load_markets()
+
+
 def remove_lock_file():
     """Remove the lock file."""
     console.print("\n[bold red]Step 4: REMOVING LOCK FILE[/bold red]")
@@ -249,10 +415,9 @@ def main():
     ))
     
     # ====== STEP 1: KILL MAIN PROCESS (PANIC FIRST!) ======
-    kill_main_process()
-    
-    # Brief delay to ensure process is dead
-    time.sleep(2)
+    # Returns only once the process has exited (or the kill attempt gave up)
+    if not kill_main_process() and LOCK_FILE.exists():
+        console.print("[yellow]⚠ Main process may still be running - continuing with emergency close anyway[/yellow]")
     
     # ====== STEP 2-3: CONNECT AND CLEAN UP ======
     try:
@@ -288,14 +453,25 @@ def main():
             exchange.set_sandbox_mode(True)
             console.print("[yellow]⚠ TESTNET MODE[/yellow]")
         
-        exchange.load_markets()
+        load_markets_fast(exchange, testnet)
         console.print("[green]✓ Connected to exchange[/green]")
         
-        # Cancel all orders
-        cancel_all_orders(exchange)
+        # Fetch positions on a second client while orders are being cancelled,
+        # so step 3 doesn't wait for another round-trip
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            positions_future = pool.submit(clone_exchange(exchange).fetch_positions)
+            
+            # Cancel all orders
+            cancel_all_orders(exchange)
+            
+            try:
+                positions = positions_future.result()
+            except Exception as e:
+                console.print(f"[yellow]⚠ Position prefetch failed: {e} - retrying[/yellow]")
+                positions = None
         
         # Close all positions
-        close_all_positions(exchange)
+        close_all_positions(exchange, positions)
         
     except Exception as e:
         console.print(f"[red]✗ Exchange error: {e}[/red]")
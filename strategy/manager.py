@@ -10,29 +10,31 @@ Implements:
 """
 
 import asyncio
+import time
 from decimal import Decimal
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Set
 from dataclasses import dataclass, field
-from datetime import datetime, timedelta
 
 from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
 
-from core.exchange import SafeExchange, ExchangeError
+from core.exchange import SafeExchange
 from core.calculator import parse_decimal, get_tick_size, floor_price_to_tick
 from core.safety import (
     get_position_side,
     get_position_qty,
-    find_stop_loss_for_position,
-    check_sl_qty_mismatch,
-    is_stop_order
+    find_stop_loss_for_position
 )
 
 console = Console()
 
+# Decimal constants for percent -> ratio conversions
+DEC_ONE = Decimal("1")
+DEC_HUNDRED = Decimal("100")
 
-@dataclass
+
+@dataclass(slots=True)
 class PositionTracker:
     """Tracks position state for trailing stop and TP timeout."""
     symbol: str
@@ -42,8 +44,12 @@ class PositionTracker:
     is_long: bool
     trailing_activated: bool = False
     last_sl_price: Decimal = Decimal("0")
-    tp_reached_time: Optional[datetime] = None  # When TP level was first reached
+    sl_order_id: Optional[str] = None  # Order last_sl_price belongs to
+    stale_sl_ids: Set[str] = field(default_factory=set)  # Replaced SLs whose cancel failed
+    tp_reached_time: Optional[float] = None  # time.monotonic() when TP level was first reached
     tp_level: Decimal = Decimal("0")  # Take profit price level
+    tp_order_id: Optional[str] = None  # Order tp_level was parsed from
+    activation_price: Decimal = Decimal("0")  # Price that activates trailing (fixed per entry)
 
 
 class PositionManager:
@@ -52,6 +58,8 @@ class PositionManager:
     
     CRITICAL: This class maintains state between iterations.
     All stop loss modifications use Ghost Synchronizer safety pattern.
+    
+    Runs on whatever event loop main.py starts (uvloop when installed).
     """
     
     def __init__(
@@ -60,7 +68,9 @@ class PositionManager:
         trailing_activation_percent: Decimal,
         trailing_callback_percent: Decimal,
         stoploss_percent: Decimal,
-        tp_timeout_seconds: int = 30
+        tp_timeout_seconds: int = 30,
+        verbose: bool = True,
+        min_sl_move_percent: Decimal = Decimal("0")
     ):
         """
         Initialize Position Manager.
@@ -71,15 +81,44 @@ class PositionManager:
             trailing_callback_percent: % callback from high/low for trailing SL (e.g., 0.5)
             stoploss_percent: Initial stop loss percent
             tp_timeout_seconds: Seconds to wait before force-closing at TP level
+            verbose: Rich panels + per-position lines (False = one-line summaries)
+            min_sl_move_percent: Min SL improvement (% of current SL) before moving it
         """
         self.exchange = exchange
-        self.trailing_activation = trailing_activation_percent / Decimal("100")
-        self.trailing_callback = trailing_callback_percent / Decimal("100")
+        self.trailing_activation = trailing_activation_percent / DEC_HUNDRED
+        self.trailing_callback = trailing_callback_percent / DEC_HUNDRED
         self.stoploss_percent = stoploss_percent
+        
+        # Price multipliers are config-derived - compute once, not per tick
+        self._long_activation_mult = DEC_ONE + self.trailing_activation
+        self._short_activation_mult = DEC_ONE - self.trailing_activation
+        self._long_callback_mult = DEC_ONE - self.trailing_callback
+        self._short_callback_mult = DEC_ONE + self.trailing_callback
+        self._min_sl_move = min_sl_move_percent / DEC_HUNDRED
         self.tp_timeout_seconds = tp_timeout_seconds
+        self.verbose = verbose
         
         # Track positions by symbol
         self._trackers: Dict[str, PositionTracker] = {}
+        
+        # Tick sizes are static market metadata - resolve once per symbol
+        self._tick_cache: Dict[str, Decimal] = {}
+    
+    def _tick_size(self, symbol: str) -> Decimal:
+        """
+        Get (cached) tick size for a symbol.
+        
+        Args:
+            symbol: Trading symbol
+            
+        Returns:
+            Tick size
+        """
+        tick_size = self._tick_cache.get(symbol)
+        if tick_size is None:
+            tick_size = get_tick_size(self.exchange.get_market_info(symbol), symbol)
+            self._tick_cache[symbol] = tick_size
+        return tick_size
     
     def _get_or_create_tracker(
         self,
@@ -95,47 +134,78 @@ class PositionManager:
             PositionTracker instance
         """
         symbol = position.get('symbol')
-        entry_price = parse_decimal(position.get('entryPrice', 0))
-        is_long = get_position_side(position) == 'LONG'
+        tracker = self._trackers.get(symbol)
         
-        if symbol not in self._trackers:
-            self._trackers[symbol] = PositionTracker(
+        if tracker is None:
+            # Entry price and side only need parsing once per position
+            entry_price = parse_decimal(position.get('entryPrice', 0))
+            is_long = get_position_side(position) == 'LONG'
+            
+            tracker = PositionTracker(
                 symbol=symbol,
                 entry_price=entry_price,
                 highest_price=entry_price,
                 lowest_price=entry_price,
-                is_long=is_long
+                is_long=is_long,
+                activation_price=entry_price * (self._long_activation_mult if is_long else self._short_activation_mult)
             )
+            self._trackers[symbol] = tracker
             console.print(f"[dim]Created tracker for {symbol} @ {entry_price}[/dim]")
         
-        return self._trackers[symbol]
+        return tracker
     
     def _remove_tracker(self, symbol: str) -> None:
         """Remove tracker when position is closed."""
-        if symbol in self._trackers:
-            del self._trackers[symbol]
+        # Next position on this symbol re-reads tick size (markets refresh hourly)
+        self._tick_cache.pop(symbol, None)
+        if self._trackers.pop(symbol, None) is not None:
             console.print(f"[dim]Removed tracker for {symbol}[/dim]")
     
     def _update_price_extremes(
         self,
         tracker: PositionTracker,
         current_price: Decimal
-    ) -> None:
+    ) -> bool:
         """
         Update highest/lowest price for position.
         
         Args:
             tracker: PositionTracker instance
             current_price: Current market price
+            
+        Returns:
+            True if a new high (LONG) or low (SHORT) was recorded
         """
         if tracker.is_long:
             if current_price > tracker.highest_price:
                 tracker.highest_price = current_price
-                console.print(f"[green]↑ New high for {tracker.symbol}: {current_price}[/green]")
+                return True
         else:
             if current_price < tracker.lowest_price:
                 tracker.lowest_price = current_price
-                console.print(f"[red]↓ New low for {tracker.symbol}: {current_price}[/red]")
+                return True
+        return False
+    
+    def _announce_activation(
+        self,
+        tracker: PositionTracker,
+        current_price: Decimal,
+        title: str
+    ) -> None:
+        """Report trailing activation (full panel only in verbose mode)."""
+        if not self.verbose:
+            console.print(f"[green]TRAIL ACTIVATED {tracker.symbol} @ {current_price}[/green]")
+            return
+        
+        console.print(Panel(
+            f"[bold green]TRAILING STOP ACTIVATED[/bold green]\n"
+            f"Symbol: {tracker.symbol}\n"
+            f"Entry: {tracker.entry_price}\n"
+            f"Current: {current_price}\n"
+            f"Activation threshold: {self.trailing_activation * 100}%",
+            title=title,
+            border_style="green"
+        ))
     
     def _check_trailing_activation(
         self,
@@ -160,33 +230,15 @@ class PositionManager:
         
         if tracker.is_long:
             # LONG: Activate when price is above entry by activation threshold
-            activation_price = tracker.entry_price * (Decimal("1") + self.trailing_activation)
-            if current_price >= activation_price:
+            if current_price >= tracker.activation_price:
                 tracker.trailing_activated = True
-                console.print(Panel(
-                    f"[bold green]TRAILING STOP ACTIVATED[/bold green]\n"
-                    f"Symbol: {tracker.symbol}\n"
-                    f"Entry: {tracker.entry_price}\n"
-                    f"Current: {current_price}\n"
-                    f"Activation threshold: {self.trailing_activation * 100}%",
-                    title="📈 TRAILING",
-                    border_style="green"
-                ))
+                self._announce_activation(tracker, current_price, "📈 TRAILING")
                 return True
         else:
             # SHORT: Activate when price is below entry by activation threshold
-            activation_price = tracker.entry_price * (Decimal("1") - self.trailing_activation)
-            if current_price <= activation_price:
+            if current_price <= tracker.activation_price:
                 tracker.trailing_activated = True
-                console.print(Panel(
-                    f"[bold green]TRAILING STOP ACTIVATED[/bold green]\n"
-                    f"Symbol: {tracker.symbol}\n"
-                    f"Entry: {tracker.entry_price}\n"
-                    f"Current: {current_price}\n"
-                    f"Activation threshold: {self.trailing_activation * 100}%",
-                    title="📉 TRAILING",
-                    border_style="green"
-                ))
+                self._announce_activation(tracker, current_price, "📉 TRAILING")
                 return True
         
         return False
@@ -206,10 +258,10 @@ class PositionManager:
         """
         if tracker.is_long:
             # LONG: SL trails below the highest price
-            return tracker.highest_price * (Decimal("1") - self.trailing_callback)
+            return tracker.highest_price * self._long_callback_mult
         else:
             # SHORT: SL trails above the lowest price
-            return tracker.lowest_price * (Decimal("1") + self.trailing_callback)
+            return tracker.lowest_price * self._short_callback_mult
     
     async def _move_stop_loss(
         self,
@@ -218,41 +270,37 @@ class PositionManager:
         new_sl_price: Decimal
     ) -> bool:
         """
-        Move stop loss to new price with safety guards.
+        Move stop loss to new (already tick-floored) price with safety guards.
         
         CRITICAL: Uses Ghost Synchronizer pattern:
         1. Verify position quantity
-        2. Cancel old SL
-        3. Place new SL with correct quantity
+        2. Place new SL with correct quantity
+        3. Cancel old SL
+        
+        The new SL is placed BEFORE the old one is cancelled, so the
+        position is never unprotected (Binance can't amend STOP_MARKET
+        orders in place). If placement fails, the old SL is untouched.
         
         Args:
             position: Position dictionary
             current_sl_order: Current stop loss order
-            new_sl_price: New stop loss price
+            new_sl_price: New stop loss price, floored to tick size
             
         Returns:
-            True if stop loss was moved successfully
+            True if the new SL was placed AND the old one cancelled (if the
+            cancel fails the old id is kept on the tracker for a retry)
         """
         symbol = position.get('symbol')
         pos_qty = get_position_qty(position)
         pos_side = get_position_side(position)
         is_long = pos_side == 'LONG'
         
-        market_info = self.exchange.get_market_info(symbol)
-        tick_size = get_tick_size(market_info, symbol)
-        floored_new_sl = floor_price_to_tick(new_sl_price, tick_size)
+        floored_new_sl = new_sl_price
         
         console.print(f"[cyan]→ Moving SL for {symbol}: {current_sl_order.get('stopPrice')} → {floored_new_sl}[/cyan]")
         
         try:
-            # Step 1: Cancel existing stop loss
-            await self.exchange.cancel_order(current_sl_order['id'], symbol)
-            console.print(f"[yellow]✓ Cancelled old SL: {current_sl_order['id']}[/yellow]")
-            
-            # Brief delay to ensure cancellation processed
-            await asyncio.sleep(0.3)
-            
-            # Step 2: Place new stop loss with ACTUAL position quantity
+            # Step 1: Place new stop loss with ACTUAL position quantity
             # (Ghost Synchronizer pattern - always use real position qty)
             sl_side = 'sell' if is_long else 'buy'
             
@@ -264,49 +312,65 @@ class PositionManager:
             )
             
             console.print(f"[green]✓ New SL placed: {new_sl_order['id']} @ {floored_new_sl}[/green]")
-            
-            # Update tracker
-            if symbol in self._trackers:
-                self._trackers[symbol].last_sl_price = floored_new_sl
-            
-            return True
-            
+        
         except Exception as e:
-            console.print(f"[red]✗ Failed to move SL: {e}[/red]")
-            
-            # CRITICAL: If we cancelled SL but failed to place new one,
-            # we need to restore protection
-            console.print("[yellow]⚠ Attempting to restore stop loss protection...[/yellow]")
-            
-            try:
-                # Calculate fallback SL price based on entry
-                entry_price = parse_decimal(position.get('entryPrice', 0))
-                if is_long:
-                    fallback_sl = entry_price * (Decimal("1") - self.stoploss_percent / Decimal("100"))
-                else:
-                    fallback_sl = entry_price * (Decimal("1") + self.stoploss_percent / Decimal("100"))
-                
-                fallback_sl = floor_price_to_tick(fallback_sl, tick_size)
-                sl_side = 'sell' if is_long else 'buy'
-                
-                await self.exchange.create_stop_market_order(
-                    symbol=symbol,
-                    side=sl_side,
-                    amount=pos_qty,
-                    stop_price=fallback_sl
-                )
-                console.print(f"[yellow]✓ Fallback SL placed @ {fallback_sl}[/yellow]")
-            except Exception as e2:
-                console.print(f"[bold red]✗ CRITICAL: Could not restore SL: {e2}[/bold red]")
-            
+            # Old SL was never touched - position is still protected
+            console.print(f"[red]✗ Failed to move SL (old SL kept): {e}[/red]")
+            return False
+        
+        # Update tracker (the new order's price is known - no need to parse it next tick)
+        tracker = self._trackers.get(symbol)
+        if tracker is not None:
+            tracker.last_sl_price = floored_new_sl
+            tracker.sl_order_id = new_sl_order.get('id')
+        
+        try:
+            # Step 2: Cancel the old (looser) stop loss
+            await self.exchange.cancel_order(current_sl_order['id'], symbol)
+            console.print(f"[yellow]✓ Cancelled old SL: {current_sl_order['id']}[/yellow]")
+        except Exception as e:
+            # Both reduce-only stops remain; the tighter new one triggers first.
+            # Remember the old one so the next pass retries the cancel and never
+            # mistakes it for the current SL
+            console.print(f"[yellow]⚠ New SL active but old SL {current_sl_order['id']} not cancelled: {e}[/yellow]")
+            if tracker is not None:
+                tracker.stale_sl_ids.add(current_sl_order['id'])
             return False
+        
+        return True
+    
+    async def _cancel_stale_stops(
+        self,
+        tracker: PositionTracker,
+        symbol_orders: List[Dict[str, Any]]
+    ) -> None:
+        """
+        Retry cancelling replaced stop losses left behind by a failed cancel.
+        
+        Ids no longer among the open orders (filled, expired or cancelled
+        elsewhere) are simply forgotten.
+        
+        Args:
+            tracker: Position tracker holding the stale SL ids
+            symbol_orders: Open orders for the tracker's symbol
+        """
+        open_ids = {o.get('id') for o in symbol_orders}
+        for order_id in list(tracker.stale_sl_ids):
+            if order_id in open_ids:
+                try:
+                    await self.exchange.cancel_order(order_id, tracker.symbol)
+                except Exception as e:
+                    console.print(f"[yellow]⚠ Old SL {order_id} for {tracker.symbol} still not cancelled: {e}[/yellow]")
+                    continue
+            tracker.stale_sl_ids.discard(order_id)
     
     async def _check_tp_timeout(
         self,
         position: Dict[str, Any],
         tracker: PositionTracker,
         current_price: Decimal,
-        open_orders: List[Dict[str, Any]]
+        tp_order: Optional[Dict[str, Any]],
+        now: float
     ) -> bool:
         """
         Check if TP level reached and timeout exceeded.
@@ -318,7 +382,8 @@ class PositionManager:
             position: Position dictionary
             tracker: PositionTracker instance
             current_price: Current market price
-            open_orders: List of open orders
+            tp_order: Take profit order for this position (None if none open)
+            now: time.monotonic() captured once for this pass
             
         Returns:
             True if position was force closed
@@ -327,13 +392,10 @@ class PositionManager:
         pos_qty = get_position_qty(position)
         is_long = tracker.is_long
         
-        # Find take profit order
-        tp_order = None
-        for order in open_orders:
-            if order.get('symbol') == symbol and order.get('type') == 'TAKE_PROFIT_MARKET':
-                tp_order = order
-                tracker.tp_level = parse_decimal(order.get('stopPrice', 0))
-                break
+        # Re-parse the TP level only when the TP order changes, not every tick
+        if tp_order and tp_order.get('id') != tracker.tp_order_id:
+            tracker.tp_level = parse_decimal(tp_order.get('stopPrice', 0))
+            tracker.tp_order_id = tp_order.get('id')
         
         if not tp_order or tracker.tp_level == 0:
             # No TP order found, reset timeout tracking
@@ -353,12 +415,12 @@ class PositionManager:
         if tp_reached:
             # First time reaching TP level
             if tracker.tp_reached_time is None:
-                tracker.tp_reached_time = datetime.now()
+                tracker.tp_reached_time = now
                 console.print(f"[yellow]⏰ {symbol}: TP level {tracker.tp_level} reached! Timeout started ({self.tp_timeout_seconds}s)[/yellow]")
                 return False
             
             # Check if timeout exceeded
-            elapsed = (datetime.now() - tracker.tp_reached_time).total_seconds()
+            elapsed = now - tracker.tp_reached_time
             if elapsed >= self.tp_timeout_seconds:
                 console.print(Panel(
                     f"[bold yellow]TP TIMEOUT - FORCE CLOSING[/bold yellow]\n"
@@ -433,93 +495,171 @@ class PositionManager:
         if not positions:
             # Clean up trackers for closed positions
             self._trackers.clear()
+            self._tick_cache.clear()
             return result
         
-        # Get current symbols with positions
-        current_symbols = {p.get('symbol') for p in positions}
-        
         # Remove trackers for closed positions
-        closed_symbols = set(self._trackers.keys()) - current_symbols
-        for symbol in closed_symbols:
+        alive = {p.get('symbol') for p in positions}
+        for symbol in [s for s in self._trackers if s not in alive]:
             self._remove_tracker(symbol)
         
         console.print("\n[bold cyan]═══ TRAILING STOP PROCESSOR ═══[/bold cyan]")
         
+        # Fetch all prices in one request (stale data guard applied per symbol)
+        try:
+            prices = await self.exchange.fetch_last_prices([p.get('symbol') for p in positions])
+        except Exception as e:
+            prices = {p.get('symbol'): e for p in positions}
+        
+        # Index orders (and TP orders) by symbol once instead of scanning all orders per position
+        orders_by_symbol: Dict[str, List[Dict[str, Any]]] = {}
+        tp_by_symbol: Dict[str, Dict[str, Any]] = {}
+        for order in open_orders:
+            order_symbol = order.get('symbol')
+            orders_by_symbol.setdefault(order_symbol, []).append(order)
+            # ccxt lowercases order types ('take_profit_market')
+            if (order.get('type') or '').upper() == 'TAKE_PROFIT_MARKET':
+                tp_by_symbol.setdefault(order_symbol, order)
+        
+        now = time.monotonic()  # One clock read per pass for all TP timeouts
+        # Routine per-symbol lines are buffered and printed with one console call per pass
+        status_lines: List[str] = []
+        waiting: List[str] = []  # Non-verbose: one summary line instead of one per position
+        holding: List[str] = []  # Non-verbose: SLs that didn't need to move
+        to_move: List[tuple] = []  # (symbol, task) - SL moves start as soon as they're decided
+        
         for position in positions:
             symbol = position.get('symbol')
+            symbol_orders = orders_by_symbol.get(symbol, [])
             result['positions_processed'] += 1
             
             try:
                 # Get or create tracker
                 tracker = self._get_or_create_tracker(position)
                 
-                # Fetch current price
-                ticker = await self.exchange.fetch_ticker(symbol)
-                current_price = parse_decimal(ticker.get('last', 0))
+                price = prices.get(symbol)
+                if isinstance(price, Exception):
+                    raise price
+                
+                current_price = parse_decimal(price or 0)
                 
                 if current_price == 0:
                     console.print(f"[yellow]⚠ Could not get price for {symbol}[/yellow]")
                     continue
                 
                 # Update price extremes
-                self._update_price_extremes(tracker, current_price)
+                if self._update_price_extremes(tracker, current_price):
+                    if tracker.is_long:
+                        status_lines.append(f"[green]↑ New high for {symbol}: {current_price}[/green]")
+                    else:
+                        status_lines.append(f"[red]↓ New low for {symbol}: {current_price}[/red]")
                 
                 # Check TP timeout (force close if TP reached but not filled)
-                if await self._check_tp_timeout(position, tracker, current_price, open_orders):
+                if await self._check_tp_timeout(position, tracker, current_price, tp_by_symbol.get(symbol), now):
                     result['tp_timeouts'] += 1
                     continue  # Position closed, skip trailing stop processing
                 
                 # Check if trailing should be activated
                 if not self._check_trailing_activation(tracker, current_price):
-                    profit_pct = ((current_price - tracker.entry_price) / tracker.entry_price * Decimal("100"))
+                    # Display-only figure (2 decimals) - float is plenty, no Decimal ops needed
+                    if tracker.entry_price:
+                        profit_pct = (float(current_price) / float(tracker.entry_price) - 1.0) * 100.0
+                    else:
+                        profit_pct = 0.0  # Unknown entry price (trailing never activates)
                     if not tracker.is_long:
                         profit_pct = -profit_pct
-                    console.print(f"[dim]{symbol}: {profit_pct:+.2f}% (waiting for {self.trailing_activation * 100}% to activate trailing)[/dim]")
+                    if self.verbose:
+                        status_lines.append(f"[dim]{symbol}: {profit_pct:+.2f}% (waiting for {self.trailing_activation * 100}% to activate trailing)[/dim]")
+                    else:
+                        waiting.append(f"{symbol.split('/')[0]} {profit_pct:+.2f}%")
                     continue
                 
                 if not tracker.trailing_activated:
                     result['trailing_activated'] += 1
                 
-                # Find current stop loss
-                sl_order = find_stop_loss_for_position(position, open_orders)
+                # Retry cancels of replaced SLs; until they're gone, skip them
+                # when looking for the current SL
+                if tracker.stale_sl_ids:
+                    stale_ids = set(tracker.stale_sl_ids)  # Just-cancelled ones are still in this snapshot
+                    await self._cancel_stale_stops(tracker, symbol_orders)
+                    symbol_orders = [o for o in symbol_orders if o.get('id') not in stale_ids]
+                
+                # Find current stop loss (prefer the one this manager placed last)
+                sl_order = None
+                if tracker.sl_order_id is not None:
+                    sl_order = next((o for o in symbol_orders if o.get('id') == tracker.sl_order_id), None)
+                if sl_order is None:
+                    sl_order = find_stop_loss_for_position(
+                        position, symbol_orders, 'LONG' if tracker.is_long else 'SHORT'
+                    )
                 
                 if not sl_order:
                     console.print(f"[red]✗ No SL found for {symbol} - skipping trailing[/red]")
                     result['errors'] += 1
                     continue
                 
-                current_sl_price = parse_decimal(sl_order.get('stopPrice', 0))
+                # Reuse the known price while the SL is the same order; an order
+                # replaced elsewhere (e.g. ghost sync) has a new id and is re-parsed
+                if sl_order.get('id') != tracker.sl_order_id:
+                    tracker.last_sl_price = parse_decimal(sl_order.get('stopPrice', 0))
+                    tracker.sl_order_id = sl_order.get('id')
+                current_sl_price = tracker.last_sl_price
                 
-                # Calculate new trailing SL
-                new_sl_price = self._calculate_trailing_sl(tracker)
+                # Calculate new trailing SL, floored to tick exactly as it would be placed
+                new_sl_price = floor_price_to_tick(
+                    self._calculate_trailing_sl(tracker), self._tick_size(symbol)
+                )
                 
                 # Only move SL if new price is BETTER (higher for long, lower for short)
+                # by at least the minimum step, so micro-drifts don't churn orders
                 should_move = False
+                min_step = current_sl_price * self._min_sl_move
                 
                 if tracker.is_long:
                     # LONG: Only move if new SL is higher than current
-                    if new_sl_price > current_sl_price:
+                    if new_sl_price > current_sl_price and new_sl_price - current_sl_price >= min_step:
                         should_move = True
-                        console.print(f"[green]↑ {symbol}: Move SL up {current_sl_price} → {new_sl_price}[/green]")
+                        status_lines.append(f"[green]↑ {symbol}: Move SL up {current_sl_price} → {new_sl_price}[/green]")
                 else:
                     # SHORT: Only move if new SL is lower than current
-                    if new_sl_price < current_sl_price:
+                    if new_sl_price < current_sl_price and current_sl_price - new_sl_price >= min_step:
                         should_move = True
-                        console.print(f"[red]↓ {symbol}: Move SL down {current_sl_price} → {new_sl_price}[/red]")
+                        status_lines.append(f"[red]↓ {symbol}: Move SL down {current_sl_price} → {new_sl_price}[/red]")
                 
                 if should_move:
-                    success = await self._move_stop_loss(position, sl_order, new_sl_price)
-                    if success:
-                        result['stops_moved'] += 1
-                    else:
-                        result['errors'] += 1
+                    # Start the move now so its round-trips overlap the rest of the pass
+                    # (e.g. a TP-timeout force close on another symbol)
+                    to_move.append((
+                        symbol,
+                        asyncio.create_task(self._move_stop_loss(position, sl_order, new_sl_price))
+                    ))
+                elif self.verbose:
+                    status_lines.append(f"[dim]{symbol}: SL @ {current_sl_price} (no move needed, trailing @ {new_sl_price})[/dim]")
                 else:
-                    console.print(f"[dim]{symbol}: SL @ {current_sl_price} (no move needed, trailing @ {new_sl_price})[/dim]")
+                    holding.append(f"{symbol.split('/')[0]} @ {current_sl_price}")
                 
             except Exception as e:
                 console.print(f"[red]✗ Error processing {symbol}: {e}[/red]")
                 result['errors'] += 1
         
+        if waiting:
+            status_lines.append(f"[dim]Waiting for {self.trailing_activation * 100}% activation: {', '.join(waiting)}[/dim]")
+        if holding:
+            status_lines.append(f"[dim]SL holding: {', '.join(holding)}[/dim]")
+        if status_lines:
+            console.print("\n".join(status_lines))
+        
+        # SL moves are independent per symbol - collect the concurrently running moves
+        if to_move:
+            moves = await asyncio.gather(*(task for _, task in to_move), return_exceptions=True)
+            for (symbol, _), moved in zip(to_move, moves):
+                if moved is True:
+                    result['stops_moved'] += 1
+                else:
+                    if isinstance(moved, Exception):
+                        console.print(f"[red]✗ Error moving SL for {symbol}: {moved}[/red]")
+                    result['errors'] += 1
+        
         # Summary
         if result['stops_moved'] > 0 or result['trailing_activated'] > 0 or result['tp_timeouts'] > 0:
             console.print(Panel(
@@ -8,10 +8,13 @@ Implements:
 """
 
 import os
+import time
 import asyncio
+import functools
 from decimal import Decimal
+from operator import itemgetter
 from typing import List, Dict, Any, Optional, Tuple
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 from rich.console import Console
 from rich.table import Table
@@ -30,6 +33,59 @@ RSI_OVERBOUGHT = float(os.getenv('RSI_OVERBOUGHT', '55'))
 EMA_FAST_PERIOD = int(os.getenv('EMA_FAST_PERIOD', '9'))
 EMA_SLOW_PERIOD = int(os.getenv('EMA_SLOW_PERIOD', '21'))
 
+# Candle settings for analysis
+OHLCV_TIMEFRAME = '1h'
+OHLCV_TIMEFRAME_MS = 60 * 60 * 1000
+OHLCV_LIMIT = 100
+
+# Cached candle history is dropped once its newest candle is this old
+OHLCV_CACHE_MAX_AGE_MS = 5 * OHLCV_TIMEFRAME_MS
+
+# OHLCV row layout: [timestamp, open, high, low, close, volume]
+_close_of = itemgetter(4)
+
+# symbol -> candle history; refreshed by fetching only the newest candles
+_ohlcv_cache: Dict[str, List[List[float]]] = {}
+
+# Max OHLCV requests in flight while scanning (keeps bursts under Binance weight limits)
+MAX_CONCURRENT_FETCHES = int(os.getenv('MAX_CONCURRENT_FETCHES', '16'))
+_fetch_semaphore = asyncio.Semaphore(MAX_CONCURRENT_FETCHES)
+
+# Volume ranking moves on a minutes scale - reuse it across iterations
+TOP_SYMBOLS_CACHE_TTL = float(os.getenv('TOP_SYMBOLS_CACHE_TTL', '30'))
+
+# Full USDT-pair volume ranking as (symbol, volume); any limit is served by slicing
+_symbols_cache: Dict[str, Any] = {'ts': 0.0, 'pairs': []}
+_volume_of = itemgetter(1)
+
+# str.endswith accepts a tuple - one call checks both Futures symbol formats
+USDT_SUFFIXES = ('/USDT:USDT', '/USDT')
+
+
+@dataclass(frozen=True, slots=True)
+class ScannerConfig:
+    """
+    Scanner thresholds and indicator periods.
+    
+    Passed through scan_market -> analyze_symbol so strategy settings can be
+    changed at runtime by passing a new instance (module defaults come from env).
+    """
+    min_volume_usdt: Decimal = MIN_VOLUME_USDT
+    min_price_usdt: Decimal = MIN_PRICE_USDT
+    rsi_period: int = RSI_PERIOD
+    rsi_oversold: float = RSI_OVERSOLD
+    rsi_overbought: float = RSI_OVERBOUGHT
+    ema_fast_period: int = EMA_FAST_PERIOD
+    ema_slow_period: int = EMA_SLOW_PERIOD
+    # Float copy for the per-symbol check against float candle closes
+    min_price_float: float = field(init=False)
+    
+    def __post_init__(self):
+        object.__setattr__(self, 'min_price_float', float(self.min_price_usdt))
+
+
+DEFAULT_SCANNER_CONFIG = ScannerConfig()
+
 
 @dataclass
 class Signal:
@@ -42,9 +98,28 @@ class Signal:
     reason: str
 
 
+@functools.lru_cache(maxsize=8)
+def stoploss_multipliers(stoploss_percent: Decimal) -> Tuple[Decimal, Decimal]:
+    """
+    Get stop loss price multipliers (computed once per stop loss setting).
+    
+    Args:
+        stoploss_percent: Stop loss percentage
+        
+    Returns:
+        Tuple of (long multiplier, short multiplier)
+    """
+    ratio = stoploss_percent / Decimal("100")
+    return Decimal("1") - ratio, Decimal("1") + ratio
+
+
 def calculate_rsi(closes: List[float], period: int = RSI_PERIOD) -> float:
     """
-    Calculate Relative Strength Index.
+    Calculate Relative Strength Index (Wilder's smoothing).
+    
+    Seeds the average gain/loss with a simple mean of the first `period`
+    changes, then applies Wilder's RMA over the rest of the history in a
+    single pass (same definition as exchange/TradingView charts).
     
     Args:
         closes: List of closing prices
@@ -56,17 +131,22 @@ def calculate_rsi(closes: List[float], period: int = RSI_PERIOD) -> float:
     if len(closes) < period + 1:
         return 50.0  # Neutral if not enough data
     
-    # Calculate price changes
-    changes = [closes[i] - closes[i-1] for i in range(1, len(closes))]
-    
-    # Get last 'period' changes
-    recent_changes = changes[-(period):]
+    avg_gain = 0.0
+    avg_loss = 0.0
     
-    gains = [c for c in recent_changes if c > 0]
-    losses = [-c for c in recent_changes if c < 0]
-    
-    avg_gain = sum(gains) / period if gains else 0
-    avg_loss = sum(losses) / period if losses else 0
+    for i in range(1, len(closes)):
+        change = closes[i] - closes[i - 1]
+        gain = change if change > 0 else 0.0
+        loss = -change if change < 0 else 0.0
+        
+        if i <= period:
+            # Seed: simple average of the first 'period' changes
+            avg_gain += gain / period
+            avg_loss += loss / period
+        else:
+            # Wilder smoothing (RMA, alpha = 1/period)
+            avg_gain = (avg_gain * (period - 1) + gain) / period
+            avg_loss = (avg_loss * (period - 1) + loss) / period
     
     if avg_loss == 0:
         return 100.0
@@ -91,17 +171,17 @@ def calculate_ema(prices: List[float], period: int) -> List[float]:
     if len(prices) < period:
         return []
     
-    ema = []
     multiplier = 2 / (period + 1)
     
     # First EMA is SMA
-    sma = sum(prices[:period]) / period
-    ema.append(sma)
+    ema_value = sum(prices[:period]) / period
+    ema = [ema_value]
+    append = ema.append
     
-    # Calculate remaining EMAs
+    # Calculate remaining EMAs (carry the previous value in a local, not ema[-1])
     for price in prices[period:]:
-        ema_value = (price - ema[-1]) * multiplier + ema[-1]
-        ema.append(ema_value)
+        ema_value = (price - ema_value) * multiplier + ema_value
+        append(ema_value)
     
     return ema
 
@@ -109,7 +189,7 @@ def calculate_ema(prices: List[float], period: int) -> List[float]:
 def detect_ema_crossover(
     fast_ema: List[float],
     slow_ema: List[float]
-) -> Optional[str]:
+) -> int:
     """
     Detect EMA crossover.
     
@@ -118,27 +198,77 @@ def detect_ema_crossover(
         slow_ema: Slow EMA values
         
     Returns:
-        'BULLISH' for bullish cross, 'BEARISH' for bearish, None otherwise
+        1 for bullish cross, -1 for bearish cross, 0 otherwise
     """
     if len(fast_ema) < 2 or len(slow_ema) < 2:
-        return None
+        return 0
     
-    # Current positions
-    fast_above_now = fast_ema[-1] > slow_ema[-1]
-    fast_above_prev = fast_ema[-2] > slow_ema[-2]
+    # bool difference: +1 fast crossed above slow, -1 crossed below, 0 no cross
+    return (fast_ema[-1] > slow_ema[-1]) - (fast_ema[-2] > slow_ema[-2])
+
+
+def prune_ohlcv_cache(now_ms: Optional[int] = None) -> None:
+    """
+    Drop cached candle histories whose newest candle is too old to extend.
     
-    if fast_above_now and not fast_above_prev:
-        return 'BULLISH'  # Fast crossed above slow
-    elif not fast_above_now and fast_above_prev:
-        return 'BEARISH'  # Fast crossed below slow
+    Args:
+        now_ms: Current time in milliseconds (defaults to wall clock)
+    """
+    if now_ms is None:
+        now_ms = int(time.time() * 1000)
     
-    return None
+    cutoff = now_ms - OHLCV_CACHE_MAX_AGE_MS
+    for symbol in [s for s, candles in _ohlcv_cache.items() if candles[-1][0] < cutoff]:
+        del _ohlcv_cache[symbol]
+
+
+async def fetch_ohlcv_cached(exchange, symbol: str) -> List[List[float]]:
+    """
+    Fetch OHLCV history, reusing cached closed candles.
+    
+    Closed candles never change, so once a symbol's history is cached only
+    the two newest candles are requested: the in-progress candle is always
+    replaced (its close is the live price), and if a new candle opened the
+    previous one is finalized and the oldest is dropped.
+    
+    Args:
+        exchange: SafeExchange instance
+        symbol: Trading symbol
+        
+    Returns:
+        List of OHLCV candles (oldest first)
+    """
+    cached = _ohlcv_cache.get(symbol)
+    
+    if cached:
+        async with _fetch_semaphore:
+            tail = await exchange.fetch_ohlcv(symbol, OHLCV_TIMEFRAME, 2)
+        if len(tail) == 2:
+            last_open = cached[-1][0]
+            if tail[1][0] == last_open:
+                candles = cached[:-1] + [tail[1]]
+            elif tail[0][0] == last_open:
+                candles = cached[1:-1] + tail
+            else:
+                candles = None  # Gap - fall through to a full refetch
+            
+            if candles is not None:
+                _ohlcv_cache[symbol] = candles
+                return candles
+    
+    async with _fetch_semaphore:
+        candles = await exchange.fetch_ohlcv(symbol, OHLCV_TIMEFRAME, OHLCV_LIMIT)
+    if candles:
+        _ohlcv_cache[symbol] = candles
+    return candles
 
 
 async def analyze_symbol(
     exchange,
     symbol: str,
-    stoploss_percent: Decimal
+    stoploss_percent: Decimal,
+    log_lines: Optional[List[str]] = None,
+    config: ScannerConfig = DEFAULT_SCANNER_CONFIG
 ) -> Optional[Signal]:
     """
     Analyze a symbol for trading signals.
@@ -147,93 +277,109 @@ async def analyze_symbol(
         exchange: SafeExchange instance
         symbol: Trading symbol
         stoploss_percent: Stop loss percentage
+        log_lines: Buffer for the per-symbol analysis line (printed directly if None)
+        config: Scanner thresholds and indicator periods
         
     Returns:
         Signal if found, None otherwise
     """
+    log = console.print if log_lines is None else log_lines.append
+    
     try:
         # Fetch OHLCV data
-        ohlcv = await exchange.fetch_ohlcv(symbol, '1h', 100)
+        ohlcv = await fetch_ohlcv_cached(exchange, symbol)
         
         if len(ohlcv) < 50:
             return None
         
-        # Extract closes
-        closes = [candle[4] for candle in ohlcv]
+        # Extract closes (C-level column getter instead of a Python-level comprehension)
+        closes = list(map(_close_of, ohlcv))
         
-        # Validate price data
-        current_price = Decimal(str(closes[-1]))
-        if current_price <= 0:
-            console.print(f"  [red]{symbol:8}[/red] │ Invalid price ({current_price}) - skipping")
+        # Validate price data (float checks - Decimal is only built for a signal)
+        last_close = closes[-1]
+        if last_close <= 0:
+            log(f"  [red]{symbol:8}[/red] │ Invalid price ({last_close}) - skipping")
             return None
         
         # Skip very low price tokens (prone to testnet issues)
-        if current_price < MIN_PRICE_USDT:
+        if last_close < config.min_price_float:
             coin_name = symbol.split('/')[0]
-            console.print(f"  [yellow]{coin_name:8}[/yellow] │ Price too low ({current_price} < {MIN_PRICE_USDT}) - skipping")
+            log(f"  [yellow]{coin_name:8}[/yellow] │ Price too low ({last_close} < {config.min_price_usdt}) - skipping")
             return None
         
         # Calculate indicators
-        rsi = calculate_rsi(closes)
-        fast_ema = calculate_ema(closes, EMA_FAST_PERIOD)
-        slow_ema = calculate_ema(closes, EMA_SLOW_PERIOD)
+        oversold = config.rsi_oversold
+        overbought = config.rsi_overbought
+        rsi = calculate_rsi(closes, config.rsi_period)
+        coin_name = symbol.split('/')[0]
+        
+        # Neutral RSI can't produce a signal whatever the EMAs say - skip them
+        if oversold <= rsi <= overbought:
+            log(f"  [cyan]{coin_name:8}[/cyan] │ RSI: [yellow]{rsi:5.1f}[/yellow] │ → [dim]RSI neutral ({rsi:.1f})[/dim]")
+            return None
+        
+        fast_ema = calculate_ema(closes, config.ema_fast_period)
+        slow_ema = calculate_ema(closes, config.ema_slow_period)
         
         crossover = detect_ema_crossover(fast_ema, slow_ema)
         
         # Get EMA position for logging
         ema_position = "BULLISH" if fast_ema[-1] > slow_ema[-1] else "BEARISH"
-        ema_cross_str = f", {crossover} cross" if crossover else ""
+        if crossover == 1:
+            ema_cross_str = ", BULLISH cross"
+        elif crossover == -1:
+            ema_cross_str = ", BEARISH cross"
+        else:
+            ema_cross_str = ""
         
-        # Log analysis details
-        coin_name = symbol.split('/')[0]
-        console.print(
+        # Log analysis details (completed with the outcome below, logged as one line)
+        analysis = (
             f"  [cyan]{coin_name:8}[/cyan] │ "
             f"RSI: [yellow]{rsi:5.1f}[/yellow] │ "
-            f"EMA: [{'green' if ema_position == 'BULLISH' else 'red'}]{ema_position}{ema_cross_str}[/{'green' if ema_position == 'BULLISH' else 'red'}]",
-            end=""
+            f"EMA: [{'green' if ema_position == 'BULLISH' else 'red'}]{ema_position}{ema_cross_str}[/{'green' if ema_position == 'BULLISH' else 'red'}]"
         )
         
         signal = None
         
         # RELAXED TESTNET LOGIC: RSI + EMA position (no crossover required)
         # LONG signal: RSI oversold + EMA is bullish (uptrend)
-        if rsi < RSI_OVERSOLD and ema_position == 'BULLISH':
-            sl_price = current_price * (Decimal("1") - stoploss_percent / Decimal("100"))
+        if rsi < oversold and ema_position == 'BULLISH':
+            current_price = Decimal(str(last_close))
+            sl_price = current_price * stoploss_multipliers(stoploss_percent)[0]
             signal = Signal(
                 symbol=symbol,
                 direction='LONG',
-                strength=min((RSI_OVERSOLD - rsi) / RSI_OVERSOLD, 1.0),
+                strength=min((oversold - rsi) / oversold, 1.0),
                 entry_price=current_price,
                 stoploss_price=sl_price,
                 reason=f"RSI oversold ({rsi:.1f}) + Bullish EMA trend"
             )
-            console.print(f" → [bold green]LONG SIGNAL![/bold green] (Strength: {signal.strength:.2f})")
+            log(f"{analysis} → [bold green]LONG SIGNAL![/bold green] (Strength: {signal.strength:.2f})")
         
         # SHORT signal: RSI overbought + EMA is bearish (downtrend)
-        elif rsi > RSI_OVERBOUGHT and ema_position == 'BEARISH':
-            sl_price = current_price * (Decimal("1") + stoploss_percent / Decimal("100"))
+        elif rsi > overbought and ema_position == 'BEARISH':
+            current_price = Decimal(str(last_close))
+            sl_price = current_price * stoploss_multipliers(stoploss_percent)[1]
             signal = Signal(
                 symbol=symbol,
                 direction='SHORT',
-                strength=min((rsi - RSI_OVERBOUGHT) / (100 - RSI_OVERBOUGHT), 1.0),
+                strength=min((rsi - overbought) / (100 - overbought), 1.0),
                 entry_price=current_price,
                 stoploss_price=sl_price,
                 reason=f"RSI overbought ({rsi:.1f}) + Bearish EMA trend"
             )
-            console.print(f" → [bold red]SHORT SIGNAL![/bold red] (Strength: {signal.strength:.2f})")
+            log(f"{analysis} → [bold red]SHORT SIGNAL![/bold red] (Strength: {signal.strength:.2f})")
         
         else:
             # Log why no signal
             reasons = []
-            if rsi >= RSI_OVERSOLD and rsi <= RSI_OVERBOUGHT:
-                reasons.append(f"RSI neutral ({rsi:.1f})")
-            elif rsi < RSI_OVERSOLD and ema_position == 'BEARISH':
+            if rsi < oversold and ema_position == 'BEARISH':
                 reasons.append(f"RSI oversold but EMA bearish")
-            elif rsi > RSI_OVERBOUGHT and ema_position == 'BULLISH':
+            elif rsi > overbought and ema_position == 'BULLISH':
                 reasons.append(f"RSI overbought but EMA bullish")
             
             reason_str = ", ".join(reasons) if reasons else "No conditions met"
-            console.print(f" → [dim]{reason_str}[/dim]")
+            log(f"{analysis} → [dim]{reason_str}[/dim]")
         
         return signal
         
@@ -245,7 +391,8 @@ async def analyze_symbol(
 async def filter_by_volume(
     exchange,
     symbols: List[str],
-    min_volume: Decimal = MIN_VOLUME_USDT
+    min_volume: Decimal = MIN_VOLUME_USDT,
+    tickers: Optional[Dict[str, Any]] = None
 ) -> List[str]:
     """
     Filter symbols by 24h volume.
@@ -254,18 +401,29 @@ async def filter_by_volume(
         exchange: SafeExchange instance
         symbols: List of symbols to filter
         min_volume: Minimum 24h volume in USDT
+        tickers: Pre-fetched tickers keyed by symbol (one batch call if None)
         
     Returns:
         Filtered list of symbols meeting volume criteria
     """
     filtered = []
+    min_volume_float = float(min_volume)
+    
+    # One batch request instead of one fetch_ticker per symbol
+    if tickers is None:
+        try:
+            tickers = await exchange.fetch_tickers()
+        except Exception as e:
+            console.print(f"[yellow]⚠ Could not fetch tickers: {e}[/yellow]")
+            return filtered
     
     for symbol in symbols:
         try:
-            ticker = await exchange.fetch_ticker(symbol)
-            volume_usdt = Decimal(str(ticker.get('quoteVolume', 0)))
-            
-            if volume_usdt >= min_volume:
+            ticker = tickers.get(symbol)
+            if not ticker:
+                continue
+            # Plain float compare - exact Decimal isn't needed for a volume threshold
+            if float(ticker.get('quoteVolume') or 0) >= min_volume_float:
                 filtered.append(symbol)
         except Exception:
             continue
@@ -277,7 +435,10 @@ async def scan_market(
     exchange,
     symbols: List[str],
     stoploss_percent: Decimal,
-    max_signals: int = 5
+    max_signals: int = 5,
+    tickers: Optional[Dict[str, Any]] = None,
+    verbose: bool = True,
+    config: Optional[ScannerConfig] = None
 ) -> List[Signal]:
     """
     Scan market for trading signals.
@@ -292,15 +453,21 @@ async def scan_market(
         symbols: List of symbols to scan
         stoploss_percent: Stop loss percentage
         max_signals: Maximum number of signals to return
+        tickers: Pre-fetched tickers keyed by symbol (for the volume filter)
+        verbose: Print one analysis line per symbol (False = one summary line)
+        config: Scanner thresholds and indicator periods (env defaults if None)
         
     Returns:
         List of signals sorted by strength
     """
+    if config is None:
+        config = DEFAULT_SCANNER_CONFIG
+    
     console.print("\n[bold cyan]═══ MARKET SCANNER ═══[/bold cyan]")
     
     # Step 1: Volume filter
     console.print(f"[dim]Filtering {len(symbols)} symbols by volume...[/dim]")
-    volume_filtered = await filter_by_volume(exchange, symbols)
+    volume_filtered = await filter_by_volume(exchange, symbols, config.min_volume_usdt, tickers=tickers)
     console.print(f"[dim]{len(volume_filtered)} symbols passed volume filter[/dim]")
     
     if not volume_filtered:
@@ -308,15 +475,27 @@ async def scan_market(
         return []
     
     # Step 2: Analyze symbols
-    console.print(f"\n[bold]Analyzing {len(volume_filtered)} symbols:[/bold]")
-    symbols_str = ', '.join([s.split('/')[0] for s in volume_filtered])
-    console.print(f"[dim]{symbols_str}[/dim]\n")
-    
-    signals = []
-    for symbol in volume_filtered:
-        signal = await analyze_symbol(exchange, symbol, stoploss_percent)
-        if signal:
-            signals.append(signal)
+    if verbose:
+        console.print(f"\n[bold]Analyzing {len(volume_filtered)} symbols:[/bold]")
+        symbols_str = ', '.join([s.split('/')[0] for s in volume_filtered])
+        console.print(f"[dim]{symbols_str}[/dim]\n")
+    
+    prune_ohlcv_cache()
+    
+    # Fetches overlap (bounded by _fetch_semaphore); per-symbol lines are
+    # buffered and rendered with one console call once all analyses finish
+    log_lines: List[str] = []
+    results = await asyncio.gather(*(
+        analyze_symbol(exchange, symbol, stoploss_percent, log_lines, config)
+        for symbol in volume_filtered
+    ))
+    signals = [signal for signal in results if signal]
+    
+    if verbose:
+        if log_lines:
+            console.print("\n".join(log_lines))
+    else:
+        console.print(f"[dim]Analyzed {len(volume_filtered)} symbols: {len(signals)} signal(s)[/dim]")
     
     # Step 3: Sort by strength and return top signals
     signals.sort(key=lambda s: s.strength, reverse=True)
@@ -350,6 +529,12 @@ async def scan_market(
     return top_signals
 
 
+def invalidate_symbol_cache() -> None:
+    """Force the next fetch_top_symbols() call to re-rank from fresh tickers."""
+    _symbols_cache['ts'] = 0.0
+    _symbols_cache['pairs'] = []
+
+
 async def fetch_top_symbols(
     exchange,
     limit: int = 15
@@ -357,6 +542,10 @@ async def fetch_top_symbols(
     """
     Fetch top symbols by 24h volume dynamically.
     
+    The ranking is cached for TOP_SYMBOLS_CACHE_TTL seconds; calls within
+    the TTL (including progressive scans with a larger limit) are served
+    from the cache without a REST request.
+    
     Args:
         exchange: SafeExchange instance
         limit: Number of top symbols to return
@@ -364,27 +553,34 @@ async def fetch_top_symbols(
     Returns:
         List of top volume symbols (USDT pairs only)
     """
+    now = time.monotonic()
+    if _symbols_cache['pairs'] and now - _symbols_cache['ts'] < TOP_SYMBOLS_CACHE_TTL:
+        return [symbol for symbol, _ in _symbols_cache['pairs'][:limit]]
+    
     try:
-        # Fetch all tickers
-        tickers = await exchange.fetch_tickers()
-        
-        # Filter for USDT pairs and extract volume data
-        usdt_pairs = []
-        for symbol, ticker in tickers.items():
-            # Accept both Futures formats: 'BTC/USDT:USDT' and 'BTC/USDT'
-            if symbol.endswith('/USDT:USDT') or symbol.endswith('/USDT'):
-                volume = float(ticker.get('quoteVolume', 0))
-                if volume > 0:
-                    usdt_pairs.append({
-                        'symbol': symbol,
-                        'volume': volume
-                    })
+        # Prefilter with the loaded market list so delisted/inactive
+        # contracts never reach the ranking (all tickers if markets are empty)
+        # Accept both Futures formats: 'BTC/USDT:USDT' and 'BTC/USDT'
+        usdt_symbols = exchange.active_symbols(USDT_SUFFIXES)
+        tickers = await exchange.fetch_tickers(usdt_symbols or None)
+        
+        # Filter for USDT pairs as (symbol, volume) tuples in one pass
+        usdt_pairs = [
+            (symbol, float(ticker.get('quoteVolume') or 0))
+            for symbol, ticker in tickers.items()
+            if symbol.endswith(USDT_SUFFIXES)
+        ]
+        usdt_pairs = [pair for pair in usdt_pairs if pair[1] > 0]
         
         # Sort by volume (descending)
-        usdt_pairs.sort(key=lambda x: x['volume'], reverse=True)
+        usdt_pairs.sort(key=_volume_of, reverse=True)
+        
+        if usdt_pairs:
+            _symbols_cache['ts'] = now
+            _symbols_cache['pairs'] = usdt_pairs
         
         # Get top N symbols
-        top_symbols = [pair['symbol'] for pair in usdt_pairs[:limit]]
+        top_symbols = [symbol for symbol, _ in usdt_pairs[:limit]]
         
         if top_symbols:
             # Display detailed table
@@ -393,11 +589,11 @@ async def fetch_top_symbols(
             table.add_column("Symbol", style="cyan")
             table.add_column("24h Volume (USDT)", style="green", justify="right")
             
-            for i, pair in enumerate(usdt_pairs[:limit], 1):
-                volume_m = pair['volume'] / 1_000_000
+            for i, (symbol, volume) in enumerate(usdt_pairs[:limit], 1):
+                volume_m = volume / 1_000_000
                 table.add_row(
                     str(i),
-                    pair['symbol'].split('/')[0],
+                    symbol.split('/')[0],
                     f"{volume_m:,.2f}M"
                 )
             
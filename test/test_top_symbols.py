@@ -3,12 +3,17 @@
 import asyncio
 import os
 from dotenv import load_dotenv
+
+# Load .env once, before core modules read their env constants at import
+load_dotenv()
+API_KEY = os.getenv('API_KEY')
+SECRET_KEY = os.getenv('SECRET_KEY')
+
 from core.exchange import create_exchange
 from strategy.scanner import fetch_top_symbols
 
 async def test():
-    load_dotenv()
-    ex = create_exchange(os.getenv('API_KEY'), os.getenv('SECRET_KEY'), True)
+    ex = create_exchange(API_KEY, SECRET_KEY, True)
     await ex.connect()
     symbols = await fetch_top_symbols(ex, 15)
     print(f'\nTop 15 symbols: {symbols}')
@@ -17,41 +17,260 @@ Date: 2024-12-30
 import os
 import sys
 import time
-import math
 import asyncio
+import functools
+import traceback
+from contextvars import ContextVar
+from dataclasses import dataclass
 from decimal import Decimal
 from pathlib import Path
-from typing import Optional, Dict, Any, Tuple
+from typing import Optional, Dict, Any, List, Tuple
 
 from dotenv import load_dotenv
 from rich.console import Console
+from rich.markup import escape
 from rich.panel import Panel
 from rich.table import Table
 
+try:
+    import uvloop  # libuv-based event loop (not available on Windows)
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
+# Load .env BEFORE importing core modules - they read env into constants at import
+load_dotenv()
+
+# A broken core module must not crash the script: Phase 1 test_imports()
+# re-imports each module and reports the failure (later phases never run)
+try:
+    from core.exchange import SafeExchange
+    from core.calculator import (
+        get_step_size, get_tick_size, floor_to_step, floor_price_to_tick, ceil_to_step,
+        calculate_position_size, validate_min_notional, parse_decimal
+    )
+    from core.execution import execute_atomic_entry, check_spread, emergency_close_position
+    from core.safety import ghost_synchronizer
+    CORE_IMPORT_ERROR: Optional[Exception] = None
+except Exception as e:
+    CORE_IMPORT_ERROR = e
+
 console = Console()
 
-# Test results tracking
-test_results: Dict[str, Dict[str, Any]] = {}
+# Print full tracebacks for failed tests (one-line location otherwise);
+# read after load_dotenv() above so it can also be set in .env
+VERIFY_VERBOSE = os.getenv('VERIFY_VERBOSE', 'false').lower() == 'true'
+
+# Polling instead of fixed sleeps while waiting for the exchange to catch up
+WAIT_TIMEOUT = 5.0
+WAIT_INTERVAL = 0.25
+
+# Lowercased order types that count as a stop loss
+SL_ORDER_TYPES = frozenset({'stop_market', 'stop', 'stop_loss', 'stop market'})
+
+# Binance accepts up to 10 orderIds per batch cancel
+BATCH_CANCEL_LIMIT = 10
+
+# (market_info, step_size, tick_size) per symbol, shared across phases
+_symbol_sizes: Dict[str, Tuple[Dict[str, Any], Decimal, Decimal]] = {}
+
+# Output buffer of the phase running in the current task (None = print directly)
+_phase_lines: ContextVar[Optional[List[str]]] = ContextVar('_phase_lines', default=None)
+
+# Test results tracking: key -> (passed, details truncated for the summary table)
+test_results: Dict[str, Tuple[bool, str]] = {}
+
+
+def emit(message: str) -> None:
+    """Print a line, or collect it if the current phase is buffering output."""
+    lines = _phase_lines.get()
+    if lines is None:
+        console.print(message)
+    else:
+        lines.append(message)
+
+
+async def run_buffered(coro):
+    """
+    Run a phase, collecting its emit() output and printing it as one block.
+    
+    Only used when Phases 3 and 4 run concurrently: each task gets its own
+    buffer (contextvars are per task) so their lines don't interleave.
+    Output printed directly by core modules (execution, safety) is not
+    captured and appears before the phase's block.
+    
+    Args:
+        coro: Phase coroutine to run
+        
+    Returns:
+        The phase's return value
+    """
+    lines: List[str] = []
+    token = _phase_lines.set(lines)
+    try:
+        return await coro
+    finally:
+        _phase_lines.reset(token)
+        if lines:
+            console.print("\n".join(lines))
+
+
+def report_exception(e: BaseException) -> None:
+    """
+    Report where a test blew up in one line (full traceback if VERIFY_VERBOSE).
+    
+    Args:
+        e: The caught exception
+    """
+    tb = e.__traceback__
+    while tb is not None and tb.tb_next is not None:
+        tb = tb.tb_next
+    where = f"{tb.tb_frame.f_code.co_name}:{tb.tb_lineno}" if tb else "?"
+    emit(f"    [dim]{type(e).__name__} at {where}[/dim]")
+    
+    if VERIFY_VERBOSE:
+        emit(escape("".join(traceback.format_exception(type(e), e, e.__traceback__))))
 
 
 def log_test(phase: str, test_name: str, passed: bool, details: str = ""):
     """Log test result."""
     key = f"{phase}:{test_name}"
-    test_results[key] = {
-        "passed": passed,
-        "details": details
-    }
+    test_results[key] = (passed, (details or "")[:50])
     status = "[green]✓ PASS[/green]" if passed else "[red]✗ FAIL[/red]"
-    console.print(f"  {status} {test_name}")
+    emit(f"  {status} {test_name}")
     if details and not passed:
-        console.print(f"    [dim]{details}[/dim]")
+        emit(f"    [dim]{details}[/dim]")
+
+
+async def wait_for(fetch, predicate, timeout: float = WAIT_TIMEOUT, interval: float = WAIT_INTERVAL):
+    """
+    Poll fetch() until predicate(result) holds or the timeout expires.
+    
+    Returns as soon as the exchange reflects the change instead of always
+    sleeping for the worst case.
+    
+    Args:
+        fetch: Zero-arg coroutine function returning the data to check
+        predicate: Function of the fetched data
+        timeout: Max seconds to wait
+        interval: Seconds between polls
+        
+    Returns:
+        The last fetched result (caller re-checks the predicate)
+    """
+    deadline = time.monotonic() + timeout
+    while True:
+        result = await fetch()
+        if predicate(result) or time.monotonic() >= deadline:
+            return result
+        await asyncio.sleep(interval)
+
+
+def is_stop_loss_order(order: Dict[str, Any]) -> bool:
+    """Check unified and raw Binance order types for a stop loss."""
+    return (
+        (order.get('type') or '').lower() in SL_ORDER_TYPES
+        or (order.get('info', {}).get('type') or '').lower() == 'stop_market'
+    )
+
+
+async def batch_cancel(exchange, symbol: str, order_ids: List[str]) -> int:
+    """
+    Cancel orders with Binance's batch endpoint (DELETE /fapi/v1/batchOrders).
+    
+    One request per BATCH_CANCEL_LIMIT ids instead of one per order. Binance
+    reports per-order failures (e.g. -2011 unknown order) as error entries
+    instead of raising, so only ids confirmed in the response count as
+    cancelled; the rest (or the whole chunk if the call fails) are retried
+    with single cancels.
+    
+    Args:
+        exchange: SafeExchange instance
+        symbol: Trading symbol
+        order_ids: Order IDs to cancel
+        
+    Returns:
+        Number of orders cancelled
+    """
+    cancelled = 0
+    for i in range(0, len(order_ids), BATCH_CANCEL_LIMIT):
+        chunk = order_ids[i:i + BATCH_CANCEL_LIMIT]
+        try:
+            entries = await exchange._retry_async(exchange.exchange.cancel_orders, chunk, symbol)
+        except Exception:
+            entries = []
+        
+        done_ids = {
+            str(entry['id']) for entry in entries
+            if entry.get('id') and not (entry.get('info') or {}).get('code')
+        }
+        done = [order_id for order_id in chunk if str(order_id) in done_ids]
+        cancelled += len(done)
+        if done:
+            emit(f"    [dim]Cancelled orders: {', '.join(done)}[/dim]")
+        
+        for order_id in chunk:
+            if str(order_id) in done_ids:
+                continue
+            try:
+                await exchange.cancel_order(order_id, symbol)
+                cancelled += 1
+            except Exception:
+                pass
+    return cancelled
+
+
+@dataclass(frozen=True, slots=True)
+class Credentials:
+    """Exchange credentials read from the environment."""
+    api_key: Optional[str]
+    secret_key: Optional[str]
+    testnet: bool
+
+
+@functools.lru_cache(maxsize=1)
+def load_credentials() -> Credentials:
+    """
+    Read credentials once (.env is loaded at module import, before the core imports).
+    
+    Returns:
+        Credentials shared by every phase
+    """
+    return Credentials(
+        api_key=os.getenv('API_KEY'),
+        secret_key=os.getenv('SECRET_KEY'),
+        testnet=os.getenv('TESTNET', 'false').lower() == 'true'
+    )
+
+
+def symbol_sizes(exchange, symbol: str) -> Tuple[Dict[str, Any], Decimal, Decimal]:
+    """
+    Get market info, step size and tick size for a symbol (cached per run).
+    
+    Args:
+        exchange: SafeExchange instance
+        symbol: Trading symbol
+        
+    Returns:
+        Tuple of (market_info, step_size, tick_size)
+    """
+    sizes = _symbol_sizes.get(symbol)
+    if sizes is None:
+        market_info = exchange.get_market_info(symbol)
+        sizes = (
+            market_info,
+            get_step_size(market_info, symbol),
+            get_tick_size(market_info, symbol)
+        )
+        _symbol_sizes[symbol] = sizes
+    return sizes
 
 
 def print_phase(phase_num: int, title: str):
     """Print phase header."""
-    console.print(f"\n[bold cyan]{'='*60}[/bold cyan]")
-    console.print(f"[bold cyan]PHASE {phase_num}: {title}[/bold cyan]")
-    console.print(f"[bold cyan]{'='*60}[/bold cyan]")
+    emit(f"\n[bold cyan]{'='*60}[/bold cyan]")
+    emit(f"[bold cyan]PHASE {phase_num}: {title}[/bold cyan]")
+    emit(f"[bold cyan]{'='*60}[/bold cyan]")
 
 
 # =============================================================================
@@ -60,8 +279,6 @@ def print_phase(phase_num: int, title: str):
 
 def test_calculator_floor_rounding():
     """Test that calculator uses math.floor correctly."""
-    from core.calculator import floor_to_step, calculate_position_size
-    
     # Test 1: floor_to_step should never round up
     test_cases = [
         (Decimal("1.999"), Decimal("1.0"), Decimal("1.0")),   # Should floor to 1
@@ -92,8 +309,6 @@ def test_calculator_floor_rounding():
 
 def test_calculator_never_rounds_up():
     """Verify calculate_position_size NEVER rounds up."""
-    from core.calculator import floor_to_step
-    
     # Fuzz test with random-like values
     test_values = [
         Decimal("0.123456789"),
@@ -116,7 +331,7 @@ def test_calculator_never_rounds_up():
             result = floor_to_step(value, step)
             if result > value:
                 all_passed = False
-                console.print(f"    [red]CRITICAL: {value} floored to {result} with step {step}[/red]")
+                emit(f"    [red]CRITICAL: {value} floored to {result} with step {step}[/red]")
     
     log_test("Phase1", "Calculator never rounds up (fuzz test)", all_passed)
     return all_passed
@@ -124,8 +339,6 @@ def test_calculator_never_rounds_up():
 
 def test_config_loading():
     """Test that .env config loads correctly."""
-    load_dotenv()
-    
     required_vars = [
         'API_KEY',
         'SECRET_KEY',
@@ -145,7 +358,7 @@ def test_config_loading():
     log_test("Phase1", "Config loading (.env)", passed, details)
     
     # Verify TESTNET is true for safety
-    testnet = os.getenv('TESTNET', 'false').lower() == 'true'
+    testnet = load_credentials().testnet
     log_test("Phase1", "TESTNET mode enabled", testnet, 
              "CRITICAL: Set TESTNET=true before running tests!" if not testnet else "")
     
@@ -187,8 +400,13 @@ def run_phase1():
     results = []
     results.append(test_imports())
     results.append(test_config_loading())
-    results.append(test_calculator_floor_rounding())
-    results.append(test_calculator_never_rounds_up())
+    
+    # Calculator tests need the core imports that test_imports() just reported on
+    if CORE_IMPORT_ERROR is None:
+        results.append(test_calculator_floor_rounding())
+        results.append(test_calculator_never_rounds_up())
+    else:
+        results.append(False)
     
     return all(results)
 
@@ -199,13 +417,10 @@ def run_phase1():
 
 async def test_exchange_connection():
     """Test exchange connection with manual URL override."""
-    from core.exchange import SafeExchange
-    
-    api_key = os.getenv('API_KEY')
-    secret_key = os.getenv('SECRET_KEY')
-    testnet = os.getenv('TESTNET', 'false').lower() == 'true'
+    creds = load_credentials()
+    testnet = creds.testnet
     
-    exchange = SafeExchange(api_key, secret_key, testnet=testnet)
+    exchange = SafeExchange(creds.api_key, creds.secret_key, testnet=testnet)
     
     try:
         await exchange.connect()
@@ -220,7 +435,7 @@ async def test_exchange_connection():
             for key, url in api_urls.items():
                 if expected_host not in url:
                     url_check_passed = False
-                    console.print(f"    [red]URL {key} doesn't point to testnet: {url}[/red]")
+                    emit(f"    [red]URL {key} doesn't point to testnet: {url}[/red]")
             
             log_test("Phase2", "Manual URL override (testnet)", url_check_passed)
         
@@ -239,10 +454,13 @@ async def test_time_sync(exchange):
         return False
     
     try:
+        t0 = time.monotonic_ns()
         server_time = await exchange.fetch_time()
-        local_time = int(time.time() * 1000)
+        rtt_ms = (time.monotonic_ns() - t0) // 1_000_000
+        local_time = time.time_ns() // 1_000_000
         
-        diff_ms = abs(server_time - local_time)
+        # Server stamped the response ~half a round trip before we read the clock
+        diff_ms = abs(server_time + rtt_ms // 2 - local_time)
         diff_seconds = diff_ms / 1000
         
         passed = diff_seconds <= 5
@@ -263,28 +481,19 @@ async def test_market_load(exchange):
     
     try:
         # Try multiple symbol formats (CCXT vs Binance native)
-        symbol_formats = ['BTC/USDT:USDT', 'BTCUSDT', 'BTC/USDT']
-        found_symbol = None
-        market_info = None
-        
-        for sym in symbol_formats:
-            try:
-                market_info = exchange.get_market_info(sym)
-                if market_info is not None:
-                    found_symbol = sym
-                    break
-            except:
-                continue
+        all_markets = exchange._markets_cache
+        found_symbol = next(
+            (sym for sym in ('BTC/USDT:USDT', 'BTCUSDT', 'BTC/USDT') if sym in all_markets),
+            None
+        )
         
         if found_symbol is None:
-            # Search in all markets
-            all_markets = exchange._markets_cache
-            for sym in all_markets:
-                if 'BTC' in sym and 'USDT' in sym:
-                    found_symbol = sym
-                    market_info = all_markets[sym]
-                    console.print(f"    [dim]Found BTC symbol: {sym}[/dim]")
-                    break
+            # Fall back to the exchange's (base, quote) index
+            found_symbol = exchange.find_symbol('BTC', 'USDT')
+            if found_symbol is not None:
+                emit(f"    [dim]Found BTC symbol: {found_symbol}[/dim]")
+        
+        market_info = all_markets[found_symbol] if found_symbol is not None else None
         
         if market_info is None:
             log_test("Phase2", "Market load (BTC)", False, "No BTC/USDT symbol found")
@@ -299,8 +508,8 @@ async def test_market_load(exchange):
                  f"precision={has_precision}, limits={has_limits}")
         
         if passed:
-            console.print(f"    [dim]Precision: {market_info.get('precision')}[/dim]")
-            console.print(f"    [dim]Limits: {market_info.get('limits')}[/dim]")
+            emit(f"    [dim]Precision: {market_info.get('precision')}[/dim]")
+            emit(f"    [dim]Limits: {market_info.get('limits')}[/dim]")
         
         return passed, found_symbol
         
@@ -339,12 +548,21 @@ async def run_phase2():
     
     exchange = await test_exchange_connection()
     if exchange is None:
-        console.print("[red]Cannot continue Phase 2 - exchange connection failed[/red]")
+        emit("[red]Cannot continue Phase 2 - exchange connection failed[/red]")
         return None, None
     
-    await test_time_sync(exchange)
-    market_ok, detected_symbol = await test_market_load(exchange)
-    await test_fetch_balance(exchange)
+    # Independent round trips - run them concurrently
+    _, market_result, _ = await asyncio.gather(
+        test_time_sync(exchange),
+        test_market_load(exchange),
+        test_fetch_balance(exchange),
+        return_exceptions=True
+    )
+    
+    if isinstance(market_result, Exception):
+        log_test("Phase2", "Market load", False, str(market_result))
+        market_result = (False, None)
+    market_ok, detected_symbol = market_result
     
     return exchange, detected_symbol
 
@@ -363,34 +581,23 @@ async def test_order_flow(exchange, symbol: str):
         log_test("Phase3", "Order flow", False, "No symbol detected")
         return False
     
-    from core.calculator import (
-        get_step_size, get_tick_size, floor_to_step, floor_price_to_tick,
-        validate_min_notional, parse_decimal
-    )
-    
     try:
         # Get market info
-        market_info = exchange.get_market_info(symbol)
-        step_size = get_step_size(market_info, symbol)
-        tick_size = get_tick_size(market_info, symbol)
+        market_info, step_size, tick_size = symbol_sizes(exchange, symbol)
         
-        console.print(f"    [dim]Step size: {step_size}, Tick size: {tick_size}[/dim]")
+        emit(f"    [dim]Step size: {step_size}, Tick size: {tick_size}[/dim]")
         
         # Get current price
         ticker = await exchange.fetch_ticker(symbol)
         current_price = parse_decimal(ticker['last'])
         
-        console.print(f"    [dim]Current price: {current_price}[/dim]")
+        emit(f"    [dim]Current price: {current_price}[/dim]")
         
         # Binance Futures min notional = 100 USDT, use ceiling to ensure minimum
         min_notional = Decimal("105.0")
-        min_qty_raw = min_notional / current_price
-        
-        import math
-        steps = math.ceil(float(min_qty_raw / step_size))
-        min_qty = Decimal(str(steps)) * step_size
+        min_qty = ceil_to_step(min_notional / current_price, step_size)
         
-        console.print(f"    [dim]Min quantity: {min_qty} (notional: {min_qty * current_price:.2f} USDT)[/dim]")
+        emit(f"    [dim]Min quantity: {min_qty} (notional: {min_qty * current_price:.2f} USDT)[/dim]")
         
         actual_notional = min_qty * current_price
         if actual_notional < Decimal("100"):
@@ -402,7 +609,7 @@ async def test_order_flow(exchange, symbol: str):
         # Test 1: Place LIMIT order far below price (won't fill)
         limit_price = floor_price_to_tick(current_price * Decimal("0.9"), tick_size)  # 10% below
         
-        console.print(f"    [dim]Placing limit order at {limit_price}...[/dim]")
+        emit(f"    [dim]Placing limit order at {limit_price}...[/dim]")
         
         try:
             limit_order = await exchange.create_limit_order(
@@ -413,12 +620,11 @@ async def test_order_flow(exchange, symbol: str):
             )
             
             order_id = limit_order.get('id')
-            console.print(f"    [dim]Limit order placed: {order_id}[/dim]")
+            emit(f"    [dim]Limit order placed: {order_id}[/dim]")
             
             log_test("Phase3", "Place LIMIT order", True)
             
-            # Cancel the order
-            await asyncio.sleep(1)  # Brief delay
+            # Cancel the order (the REST ack already means it is on the book)
             await exchange.cancel_order(order_id, symbol)
             
             log_test("Phase3", "Cancel LIMIT order", True)
@@ -443,38 +649,27 @@ async def test_atomic_entry(exchange, symbol: str):
         log_test("Phase3", "Atomic entry", False, "No symbol detected")
         return None
     
-    from core.calculator import (
-        get_step_size, get_tick_size, floor_to_step, floor_price_to_tick,
-        parse_decimal
-    )
-    from core.execution import execute_atomic_entry, check_spread
-    
     stoploss_percent = Decimal("2.0")
     
     try:
         # Get market info
-        market_info = exchange.get_market_info(symbol)
-        step_size = get_step_size(market_info, symbol)
-        tick_size = get_tick_size(market_info, symbol)
+        market_info, step_size, tick_size = symbol_sizes(exchange, symbol)
         
         # Check spread first - skip if bid/ask is None (testnet issue)
         try:
             bid, ask, spread_ratio = await check_spread(exchange, symbol)
             log_test("Phase3", "Spread check", True)
         except Exception as e:
-            console.print(f"    [yellow]⚠ Spread check skipped (testnet): {e}[/yellow]")
+            emit(f"    [yellow]⚠ Spread check skipped (testnet): {e}[/yellow]")
             log_test("Phase3", "Spread check", True, "Skipped on testnet")
         
         ticker = await exchange.fetch_ticker(symbol)
         current_price = parse_decimal(ticker['last'])
         
         min_notional = Decimal("105.0")
-        min_qty_raw = min_notional / current_price
-        import math
-        steps = math.ceil(float(min_qty_raw / step_size))
-        min_qty = Decimal(str(steps)) * step_size
+        min_qty = ceil_to_step(min_notional / current_price, step_size)
         
-        console.print(f"    [dim]Quantity: {min_qty} (notional: {min_qty * current_price:.2f} USDT)[/dim]")
+        emit(f"    [dim]Quantity: {min_qty} (notional: {min_qty * current_price:.2f} USDT)[/dim]")
         
         # Calculate stop loss price (2% below for long)
         stoploss_price = floor_price_to_tick(
@@ -482,10 +677,10 @@ async def test_atomic_entry(exchange, symbol: str):
             tick_size
         )
         
-        console.print(f"    [dim]Attempting atomic entry:[/dim]")
-        console.print(f"    [dim]  Symbol: {symbol}[/dim]")
-        console.print(f"    [dim]  Quantity: {min_qty}[/dim]")
-        console.print(f"    [dim]  Stop Loss: {stoploss_price}[/dim]")
+        emit(f"    [dim]Attempting atomic entry:[/dim]")
+        emit(f"    [dim]  Symbol: {symbol}[/dim]")
+        emit(f"    [dim]  Quantity: {min_qty}[/dim]")
+        emit(f"    [dim]  Stop Loss: {stoploss_price}[/dim]")
         
         # Execute atomic entry (no market_info param)
         entry_result = await execute_atomic_entry(
@@ -533,8 +728,7 @@ async def test_atomic_entry(exchange, symbol: str):
         
     except Exception as e:
         log_test("Phase3", "Atomic entry", False, str(e))
-        import traceback
-        traceback.print_exc()
+        report_exception(e)
         return None
 
 
@@ -544,26 +738,18 @@ async def test_panic_close(exchange, position_info: dict):
         log_test("Phase3", "Panic close", False, "No position to close")
         return False
     
-    # Import panic functions (adapted for async)
     try:
-        from core.execution import emergency_close_position
-        
         symbol = position_info['symbol']
         qty = position_info['qty']
         is_long = position_info['side'] == 'buy'
         
-        console.print(f"    [dim]Closing position: {symbol}, qty={qty}, long={is_long}[/dim]")
+        emit(f"    [dim]Closing position: {symbol}, qty={qty}, long={is_long}[/dim]")
         
         # First cancel all orders for this symbol
         try:
             orders = await exchange.fetch_open_orders(symbol)
-            for order in orders:
-                try:
-                    await exchange.cancel_order(order['id'], symbol)
-                    console.print(f"    [dim]Cancelled order: {order['id']}[/dim]")
-                except:
-                    pass
-        except:
+            await batch_cancel(exchange, symbol, [o['id'] for o in orders])
+        except Exception:
             pass
         
         # Close position
@@ -583,14 +769,14 @@ async def run_phase3(exchange, symbol: str):
     print_phase(3, "EXECUTION TESTS (Real Money on Testnet)")
     
     if exchange is None:
-        console.print("[red]Cannot run Phase 3 - exchange not connected[/red]")
+        emit("[red]Cannot run Phase 3 - exchange not connected[/red]")
         return
     
     if symbol is None:
-        console.print("[red]Cannot run Phase 3 - no symbol detected[/red]")
+        emit("[red]Cannot run Phase 3 - no symbol detected[/red]")
         return
     
-    console.print(f"    [dim]Using symbol: {symbol}[/dim]")
+    emit(f"    [dim]Using symbol: {symbol}[/dim]")
     
     # Test order creation/cancellation
     await test_order_flow(exchange, symbol)
@@ -598,9 +784,6 @@ async def run_phase3(exchange, symbol: str):
     # Test atomic entry with stop loss
     position_info = await test_atomic_entry(exchange, symbol)
     
-    # Give exchange a moment to process
-    await asyncio.sleep(2)
-    
     # Test panic close
     if position_info:
         await test_panic_close(exchange, position_info)
@@ -620,30 +803,19 @@ async def test_ghost_synchronizer(exchange, symbol: str):
         log_test("Phase4", "Ghost synchronizer", False, "No symbol detected")
         return False
     
-    from core.calculator import (
-        get_step_size, get_tick_size, floor_to_step, floor_price_to_tick,
-        parse_decimal
-    )
-    from core.safety import ghost_synchronizer
-    
     stoploss_percent = Decimal("2.0")
     
     try:
         # Step 1: Open a small position
-        market_info = exchange.get_market_info(symbol)
-        step_size = get_step_size(market_info, symbol)
-        tick_size = get_tick_size(market_info, symbol)
+        market_info, step_size, tick_size = symbol_sizes(exchange, symbol)
         
         ticker = await exchange.fetch_ticker(symbol)
         current_price = parse_decimal(ticker['last'])
         
         min_notional = Decimal("105.0")
-        min_qty_raw = min_notional / current_price
-        import math
-        steps = math.ceil(float(min_qty_raw / step_size))
-        min_qty = Decimal(str(steps)) * step_size
+        min_qty = ceil_to_step(min_notional / current_price, step_size)
         
-        console.print(f"    [dim]Opening test position: {min_qty} {symbol} (notional: {min_qty * current_price:.2f} USDT)[/dim]")
+        emit(f"    [dim]Opening test position: {min_qty} {symbol} (notional: {min_qty * current_price:.2f} USDT)[/dim]")
         
         # Place market order (no stop loss initially)
         entry_order = await exchange.create_market_order(symbol, 'buy', float(min_qty))
@@ -656,38 +828,38 @@ async def test_ghost_synchronizer(exchange, symbol: str):
         log_test("Phase4", "Open test position (no SL)", True)
         
         # Step 2: Verify we have a position without SL
-        await asyncio.sleep(1)
+        def position_open(snapshot) -> bool:
+            return any(
+                pos.get('symbol') == symbol
+                and parse_decimal(pos.get('contracts', pos.get('contractSize', 0))) > 0
+                for pos in snapshot[0]
+            )
         
-        positions = await exchange.fetch_positions()
-        has_position = False
-        for pos in positions:
-            if pos.get('symbol') == symbol:
-                pos_qty = parse_decimal(pos.get('contracts', pos.get('contractSize', 0)))
-                if pos_qty > 0:
-                    has_position = True
-                    break
+        snapshot = await wait_for(
+            lambda: asyncio.gather(
+                exchange.fetch_positions(),
+                exchange.fetch_open_orders(symbol)
+            ),
+            position_open
+        )
+        positions, orders = snapshot
+        has_position = position_open(snapshot)
         
         if not has_position:
             log_test("Phase4", "Verify position exists", False, "Position not found")
             return False
         
         # Verify no stop loss exists
-        orders = await exchange.fetch_open_orders(symbol)
-        sl_exists = any(
-            o.get('type', '').lower() in ['stop_market', 'stop', 'stop_loss']
-            for o in orders
-        )
+        sl_orders = [o for o in orders if is_stop_loss_order(o)]
         
-        if sl_exists:
-            console.print("    [yellow]Stop loss already exists, cancelling for test...[/yellow]")
-            for order in orders:
-                if order.get('type', '').lower() in ['stop_market', 'stop', 'stop_loss']:
-                    await exchange.cancel_order(order['id'], symbol)
+        if sl_orders:
+            emit("    [yellow]Stop loss already exists, cancelling for test...[/yellow]")
+            await batch_cancel(exchange, symbol, [o['id'] for o in sl_orders])
         
         log_test("Phase4", "Position has NO stop loss", True)
         
         # Step 3: Run Ghost Synchronizer
-        console.print("    [dim]Running Ghost Synchronizer...[/dim]")
+        emit("    [dim]Running Ghost Synchronizer...[/dim]")
         
         sync_result = await ghost_synchronizer(exchange, stoploss_percent, symbol)
         
@@ -698,33 +870,28 @@ async def test_ghost_synchronizer(exchange, symbol: str):
         log_test("Phase4", "Ghost sync detected missing SL", fixed_sl,
                  f"Result: {sync_result}")
         
-        # Step 4: Verify SL now exists (wait longer for exchange to process)
-        await asyncio.sleep(3)  # Increased delay
-        orders = await exchange.fetch_open_orders(symbol)
-        
-        # Check multiple type names
-        sl_now_exists = any(
-            o.get('type', '').lower() in ['stop_market', 'stop', 'stop_loss', 'stop market']
-            or o.get('info', {}).get('type', '').lower() == 'stop_market'
-            for o in orders
+        # Step 4: Verify SL now exists (poll until the exchange shows it)
+        orders = await wait_for(
+            lambda: exchange.fetch_open_orders(symbol),
+            lambda found: any(is_stop_loss_order(o) for o in found)
         )
         
-        # Log what we found
-        console.print(f"    [dim]Open orders after ghost sync: {len(orders)}[/dim]")
+        # Check multiple type names and log what we found in one pass
+        sl_now_exists = False
+        emit(f"    [dim]Open orders after ghost sync: {len(orders)}[/dim]")
         for o in orders:
-            console.print(f"    [dim]  - Type: {o.get('type')}, Info type: {o.get('info', {}).get('type')}[/dim]")
+            if is_stop_loss_order(o):
+                sl_now_exists = True
+            emit(f"    [dim]  - Type: {o.get('type')}, Info type: {o.get('info', {}).get('type')}[/dim]")
         
         log_test("Phase4", "Ghost sync created SL", sl_now_exists or fixed_sl)
         
         # Step 5: Cleanup - close the position
-        console.print("    [dim]Cleaning up test position...[/dim]")
+        emit("    [dim]Cleaning up test position...[/dim]")
         
         # Cancel all orders
-        for order in await exchange.fetch_open_orders(symbol):
-            try:
-                await exchange.cancel_order(order['id'], symbol)
-            except:
-                pass
+        orders = await exchange.fetch_open_orders(symbol)
+        await batch_cancel(exchange, symbol, [o['id'] for o in orders])
         
         # Close position
         try:
@@ -737,8 +904,7 @@ async def test_ghost_synchronizer(exchange, symbol: str):
         
     except Exception as e:
         log_test("Phase4", "Ghost synchronizer test", False, str(e))
-        import traceback
-        traceback.print_exc()
+        report_exception(e)
         return False
 
 
@@ -747,14 +913,14 @@ async def run_phase4(exchange, symbol: str):
     print_phase(4, "SAFETY TESTS")
     
     if exchange is None:
-        console.print("[red]Cannot run Phase 4 - exchange not connected[/red]")
+        emit("[red]Cannot run Phase 4 - exchange not connected[/red]")
         return
     
     if symbol is None:
-        console.print("[red]Cannot run Phase 4 - no symbol detected[/red]")
+        emit("[red]Cannot run Phase 4 - no symbol detected[/red]")
         return
     
-    console.print(f"    [dim]Using symbol: {symbol}[/dim]")
+    emit(f"    [dim]Using symbol: {symbol}[/dim]")
     
     await test_ghost_synchronizer(exchange, symbol)
 
@@ -779,11 +945,10 @@ def print_summary():
     passed_count = 0
     failed_count = 0
     
-    for key, result in test_results.items():
-        status = "[green]PASS[/green]" if result['passed'] else "[red]FAIL[/red]"
-        table.add_row(key, status, result.get('details', '')[:50])
+    for key, (passed, details) in test_results.items():
+        table.add_row(key, "[green]PASS[/green]" if passed else "[red]FAIL[/red]", details)
         
-        if result['passed']:
+        if passed:
             passed_count += 1
         else:
             failed_count += 1
@@ -815,9 +980,6 @@ async def main():
         border_style="cyan"
     ))
     
-    # Load environment
-    load_dotenv()
-    
     # Run Phase 1
     phase1_passed = run_phase1()
     
@@ -839,11 +1001,19 @@ async def main():
     else:
         console.print("[yellow]⚠ Could not detect symbol - Phase 3 & 4 may fail[/yellow]")
     
-    # Run Phase 3
-    await run_phase3(exchange, detected_symbol)
+    # Phase 4 opens and closes its own position, so on a second symbol it
+    # can run alongside Phase 3 (same symbol would mix their orders/positions)
+    safety_symbol = exchange.find_symbol('ETH', 'USDT')
     
-    # Run Phase 4
-    await run_phase4(exchange, detected_symbol)
+    if detected_symbol and safety_symbol and safety_symbol != detected_symbol:
+        console.print(f"[dim]Running Phase 3 ({detected_symbol}) and Phase 4 ({safety_symbol}) concurrently[/dim]")
+        await asyncio.gather(
+            run_buffered(run_phase3(exchange, detected_symbol)),
+            run_buffered(run_phase4(exchange, safety_symbol))
+        )
+    else:
+        await run_phase3(exchange, detected_symbol)
+        await run_phase4(exchange, detected_symbol)
     
     # Cleanup
     if exchange:
@@ -855,10 +1025,15 @@ async def main():
 
 if __name__ == "__main__":
     try:
-        asyncio.run(main())
+        if UVLOOP_AVAILABLE and sys.version_info >= (3, 12):
+            # Same loop as main.py so the test exercises the bot's runtime
+            asyncio.run(main(), loop_factory=uvloop.new_event_loop)
+        else:
+            if UVLOOP_AVAILABLE:
+                asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+            asyncio.run(main())
     except KeyboardInterrupt:
         console.print("\n[yellow]Test interrupted by user[/yellow]")
     except Exception as e:
         console.print(f"\n[red]Fatal error: {e}[/red]")
-        import traceback
         traceback.print_exc()